@@ -2,6 +2,10 @@ from nastranpy.bdf.model import Model
 from nastranpy.bdf.cards.card import Card
 from nastranpy.bdf.cards.class_factory import card_classes
 from nastranpy.bdf.read_bdf import cards_in_file
+from nastranpy.bdf.read_batched import cards_in_file_batched, CardBatch
+from nastranpy.bdf.id_index import IdIndex
+from nastranpy.bdf.cache import IncludeCache
+from nastranpy.bdf.read_bulk import bulk_cards_in_file, BulkCards
 from nastranpy.bdf.write_bdf import print_card
 from nastranpy.setup_logging import setup_logging
 import nastranpy.utils as utils
@@ -0,0 +1,128 @@
+import os
+import pickle
+import hashlib
+from nastranpy.bdf.misc import file_stamp
+
+
+class IncludeCache(object):
+    version = 1
+
+    def __init__(self, path, check_hash=False):
+        """
+        Initialize an on-disk cache of parsed include files.
+
+        Each include file is stored as a pickled list of card fields. A cached
+        include is only used while the file keeps the same size and modification
+        time (and the same content hash, if `check_hash` is True).
+
+        Parameters
+        ----------
+        path : str
+            Cache directory.
+        check_hash : bool, optional
+            Whether or not to check the content hash of the files (safer but
+            slower, as the whole file has to be readed).
+        """
+        self.path = path
+        self.check_hash = check_hash
+
+    def _cache_file(self, file, card_names, ignore_comments):
+        key = repr((os.path.abspath(file), sorted(card_names) if card_names else None,
+                    bool(ignore_comments)))
+        return os.path.join(self.path, hashlib.sha1(key.encode()).hexdigest() + '.pickle')
+
+    @staticmethod
+    def file_hash(file):
+        file_hash = hashlib.sha1()
+
+        with open(file, 'rb') as f:
+
+            for chunk in iter(lambda: f.read(2 ** 20), b''):
+                file_hash.update(chunk)
+
+        return file_hash.hexdigest()
+
+    def get(self, file, card_names=None, ignore_comments=False):
+        """
+        Get the cached fields of an include file.
+
+        Parameters
+        ----------
+        file : str
+            Include file path.
+        card_names : list of str, optional
+            Card names readed.
+        ignore_comments : bool, optional
+            Whether or not the comments were ignored.
+
+        Returns
+        -------
+        list of tuple or None
+            [(fields, is_large_field, is_free_field, comment), ...] or None if the
+            file is not cached (or it has changed since it was cached).
+        """
+
+        try:
+            stamp = file_stamp(file)
+
+            with open(self._cache_file(file, card_names, ignore_comments), 'rb') as f:
+                cached = pickle.load(f)
+
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return None
+
+        if cached['version'] != self.version or cached['stamp'] != stamp:
+            return None
+
+        if self.check_hash and cached['hash'] != self.file_hash(file):
+            return None
+
+        return cached['cards']
+
+    def set(self, file, cards, card_names=None, ignore_comments=False, stamp=None):
+        """
+        Cache the fields of an include file.
+
+        Parameters
+        ----------
+        file : str
+            Include file path.
+        cards : list of tuple
+            [(fields, is_large_field, is_free_field, comment), ...]
+        card_names : list of str, optional
+            Card names readed.
+        ignore_comments : bool, optional
+            Whether or not the comments were ignored.
+        stamp : tuple, optional
+            Size and modification time of the file when it was readed (the default
+            is None, which implies the current ones).
+        """
+
+        if stamp is None:
+            stamp = file_stamp(file)
+
+        cached = {
+            'version': self.version,
+            'file': os.path.abspath(file),
+            'stamp': stamp,
+            'hash': self.file_hash(file) if self.check_hash else None,
+            'cards': cards,
+        }
+
+        os.makedirs(self.path, exist_ok=True)
+        cache_file = self._cache_file(file, card_names, ignore_comments)
+
+        with open(cache_file + '.tmp', 'wb') as f:
+            pickle.dump(cached, f, pickle.HIGHEST_PROTOCOL)
+
+        os.replace(cache_file + '.tmp', cache_file)
+
+    def clear(self):
+        """Remove all the cached files."""
+
+        if os.path.isdir(self.path):
+
+            for file in os.listdir(self.path):
+
+                if file.endswith('.pickle'):
+                    os.remove(os.path.join(self.path, file))
@@ -1,12 +1,16 @@
+import sys
 import numpy as np
 import logging
+from copy import copy
 from nastranpy.bdf.observable import Observable
-from nastranpy.bdf.write_bdf import print_card
+from nastranpy.bdf.write_bdf import print_card, format_comment
 from nastranpy.bdf.cards.card_list import CardList
 from nastranpy.bdf.cards.card_set import CardSet
 
 
 class Card(Observable):
+    __slots__ = ('fields', 'large_field', 'free_field', 'is_commented', 'comment', '_include', '_is_processed',
+                 '_is_edited', '_printed')
     type = None
     tag = None
     _scheme = None
@@ -29,12 +33,15 @@ class Card(Observable):
             else:
                 break
 
+        self.fields[0] = sys.intern(self.fields[0]) # Card names are shared by all the cards of the same kind
         self.large_field = large_field
         self.free_field = free_field
         self.is_commented = False
         self.comment = ''
         self._include = None
         self._is_processed = False
+        self._is_edited = False
+        self._printed = None # {(large_field, free_field, is_commented, comment_symbol): card text}
 
     def __repr__(self):
         return "'{} {}'".format(self.name, self.id)
@@ -67,7 +74,11 @@ class Card(Observable):
 
     @property
     def id(self):
-        return self.fields[1]
+
+        try:
+            return self.fields[1]
+        except IndexError: # Blank id (trailing blank fields are dropped)
+            return None
 
     @id.setter
     def id(self, value):
@@ -76,6 +87,11 @@ class Card(Observable):
             self.changed = True
             self._notify(new_id=value)
             self.fields[1] = int(value)
+            self._set_modified()
+
+            # Referring cards are printed with the new id too
+            for card in self.child_cards():
+                card._set_modified()
 
     @property
     def include(self):
@@ -85,6 +101,7 @@ class Card(Observable):
     def include(self, value):
 
         if not self._include is value:
+            self._set_modified()
 
             if self._include:
 
@@ -102,8 +119,24 @@ class Card(Observable):
                 except AttributeError:
                     pass
 
+            self._set_modified()
+
+    def _set_modified(self):
+        # Flag the card to be printed again and its include file to be written (only for cards
+        # already processed, so cards being readed don't flag their include files)
+        self._printed = None
+
+        if self._is_processed:
+            self._is_edited = True
+
+            try:
+                self._include.is_modified = True
+            except AttributeError: # No include file (or not classified yet)
+                pass
+
     def _update(self, caller, **kwargs):
-        pass
+        # Referred cards changed (i.e. renumbered or moved)
+        self._printed = None
 
     def parent_cards(self, type=None):
         return (field for field, _, _ in self._get_fields() if
@@ -132,7 +165,8 @@ class Card(Observable):
 
         return fields[:last_index + 1]
 
-    def print(self, large_field=None, free_field=None, print_comment=False, is_commented=None, comment_symbol='$: '):
+    def print(self, large_field=None, free_field=None, print_comment=False, is_commented=None, comment_symbol='$: ',
+              cache=True, _fields=None):
 
         if large_field is None:
             large_field = self.large_field
@@ -148,11 +182,35 @@ class Card(Observable):
         if is_commented is None:
             is_commented = self.is_commented
 
-        return print_card(self.get_fields(), large_field=large_field, free_field=free_field,
-                          comment=comment, is_commented=is_commented, comment_symbol=comment_symbol)
+        # The card text is cached by format until the card changes (see `_set_modified` and `_update`).
+        # `_fields` are the fields of the card with its real fields already formatted (see `print_cards`)
+        key = (large_field, free_field, is_commented, comment_symbol)
+
+        try:
+            card = self._printed[key]
+        except (TypeError, KeyError):
+            fields = self.get_fields() if _fields is None else _fields
+            card = print_card(fields, large_field=large_field, free_field=free_field,
+                              is_commented=is_commented, comment_symbol=comment_symbol)
+
+            if cache:
+
+                if self._printed is None:
+                    self._printed = dict()
+
+                self._printed[key] = card
+
+        return format_comment(comment, is_commented, comment_symbol) + card
+
+    def _is_cached(self, is_commented=None, comment_symbol='$: '):
+
+        if is_commented is None:
+            is_commented = self.is_commented
+
+        return bool(self._printed) and (self.large_field, self.free_field, is_commented, comment_symbol) in self._printed
 
     def head(self, lines=5):
-        card = print_card(self.get_fields()).split('\n')
+        card = self.print(large_field=False, free_field=False, is_commented=False).split('\n')
 
         if len(card) > lines:
             return '\n'.join(card[:lines] + ['... and other {} line/s'.format(len(card) - lines)])
@@ -250,7 +308,7 @@ class Card(Observable):
                         field._subscribe(self)
 
                         if field_info.update_grid:
-                            field.elems.add(self)
+                            field._add_elem(self)
                     except AttributeError:
                         pass
 
@@ -276,6 +334,17 @@ class Card(Observable):
                         self.fields[index] = self._get_field(fields, optional_field_info, items)
 
         self._is_processed = True
+        self._printed = None
+
+    def _unprocess_fields(self):
+        fields = self.get_fields()
+
+        if self._padding:
+            fields = self._padding.unpadded(fields)
+
+        self.fields = [field if field != '' else None for field in fields]
+        self._is_processed = False
+        self._printed = None
 
     def _split(self):
 
@@ -287,6 +356,10 @@ class Card(Observable):
                 new_card._split()
                 del self.fields[index:]
 
+                # Both cards are printed apart from now on
+                self._is_edited = True
+                new_card._is_edited = True
+
     def _get_fields(self):
 
         if self._scheme and self._is_processed:
@@ -343,7 +416,7 @@ class Card(Observable):
         new_card.is_commented = self.is_commented
         new_card.comment = self.comment
         new_card.include = self.include
-        new_card.observers = self.observers.copy()
+        new_card._observers = copy(self._observers)
         new_card.changed = True
         new_card._notify(new_card=new_card)
         return new_card
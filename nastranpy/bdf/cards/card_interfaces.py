@@ -1,3 +1,4 @@
+import numpy as np
 from nastranpy.bdf.cards.padding import Padding
 
 
@@ -33,11 +34,64 @@ seq_types = ('vector', 'list', 'set')
 item_type_sorting = {item_type: str(i).ljust(2, '0') for i, item_type in
                      enumerate(item_types + set_types)}
 
+def is_plain(ids):
+    # Whether or not the ids are sorted the same as numbers and as strings (see `sorted_cards`)
+    return ids.dtype.kind == 'i' and (not len(ids) or ids.min() >= 0 and ids.max() < 10 ** 8)
+
+
 def sorted_cards(cards):
-    return sorted(cards, key=lambda card: ('99' if card.type is None else
-                                           item_type_sorting[card.type]) +
-                                          card.name.ljust(8, '0') +
-                                          str(card.id).rjust(8, '0'))
+    """
+    Sort cards by type, name and id.
+
+    The order is the one given by the key `type_rank + name.ljust(8, '0') +
+    str(id).rjust(8, '0')`, but computed with integer keys (type and name rank,
+    and id) sorted at once with `numpy.lexsort`. Ids are ranked as strings only
+    for the card names with ids that aren't 8-digit integers at most (i.e.
+    INCLUDE cards).
+
+    Parameters
+    ----------
+    cards : iterable of Card
+        Cards to sort.
+
+    Returns
+    -------
+    list of Card
+        Sorted cards.
+    """
+    cards = list(cards)
+
+    if not cards:
+        return cards
+
+    # Name and id of each card are taken from its fields (faster than through the properties).
+    # Cards are grouped by name (all the cards with the same name have the same type)
+    cards_fields = [card.fields for card in cards]
+    names, first_indexes, group_indexes = np.unique([fields[0] for fields in cards_fields], return_index=True,
+                                                    return_inverse=True)
+    group_indexes = group_indexes.reshape(-1)
+    group_keys = [('99' if cards[index].type is None else item_type_sorting[cards[index].type]) +
+                  card_name.ljust(8, '0') for card_name, index in zip(names.tolist(), first_indexes.tolist())]
+    group_ranks = np.unique(group_keys, return_inverse=True)[1].reshape(-1)
+    ids = [fields[1] if len(fields) > 1 else None for fields in cards_fields] # Cards with a blank id
+    id_keys = np.array(ids)
+
+    if not is_plain(id_keys):
+        ids = np.array(ids, dtype=object)
+        id_keys = np.zeros(len(cards), np.int64)
+        groups = np.split(np.argsort(group_indexes, kind='stable'), np.cumsum(np.bincount(group_indexes))[:-1])
+
+        for indexes in groups:
+            group_ids = ids[indexes].tolist()
+            group_id_keys = np.array(group_ids)
+
+            if is_plain(group_id_keys):
+                id_keys[indexes] = group_id_keys
+            else:
+                id_strings = [str(card_id).rjust(8, '0') for card_id in group_ids]
+                id_keys[indexes] = np.unique(id_strings, return_inverse=True)[1].reshape(-1)
+
+    return [cards[index] for index in np.lexsort((id_keys, group_ranks[group_indexes])).tolist()]
 
 card_interfaces = {
     # Grids
@@ -24,8 +24,8 @@ def bar_settle_factory(card_name):
                 if self.grids[0].coord:
                     self.grids[0].coord.get_xyz0(v, is_vector=True)
 
-            G1 += self.offsetA
-            G2 += self.offsetB
+            G1 = G1 + self.offsetA
+            G2 = G2 + self.offsetB
 
         self._coord = CoordSystem(G1, G2, G1 + v, method=2)
         self._length = np.linalg.norm(G2 - G1)
@@ -63,10 +63,10 @@ def shell_settle_factory(card_name):
             self._coord = CoordSystem(origin, origin + n, origin + v1 + v2)
             self._normal = self._coord.M[2]
             # Project grid points over the mean plane
-            G1 -=  mean_offset
-            G2 +=  mean_offset
-            G3 -=  mean_offset
-            G4 +=  mean_offset
+            G1 = G1 - mean_offset
+            G2 = G2 + mean_offset
+            G3 = G3 - mean_offset
+            G4 = G4 + mean_offset
             area1 = 0.5 * diagonal * np.dot(G1 - G2, np.cross(self._coord.M[2], v2))
             area2 = 0.5 * diagonal * np.dot(G4 - G1, np.cross(self._coord.M[2], v2))
             self._area = area1 + area2
@@ -285,3 +285,15 @@ card_interfaces_additional = {
     # LOADs
 }
 
+
+
+# Attributes set by the functions above (cards have no instance dictionary)
+card_slots_additional = {
+    # Elements
+    'CROD': ('_length', '_axis', '_centroid'),
+    'CONROD': ('_length', '_axis', '_centroid'),
+    'CBAR': ('_length', '_axis', '_centroid'),
+    'CBEAM': ('_length', '_axis', '_centroid'),
+    'CQUAD4': ('_normal', '_area', '_centroid'),
+    'CTRIA3': ('_normal', '_area', '_centroid'),
+}
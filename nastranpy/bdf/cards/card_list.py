@@ -1,4 +1,5 @@
 class CardList(object):
+    __slots__ = ('_observer', '_cards', '_update_grid')
 
     def __init__(self, observer, cards=None, update_grid=False):
         self._observer = observer
@@ -37,7 +38,7 @@ class CardList(object):
                 old_value._unsubscribe(self._observer)
 
                 if self._update_grid:
-                    old_value.elems.remove(self._observer)
+                    old_value._remove_elem(self._observer)
             except AttributeError:
                 pass
 
@@ -45,11 +46,12 @@ class CardList(object):
                 value._subscribe(self._observer)
 
                 if self._update_grid:
-                    value.elems.add(self._observer)
+                    value._add_elem(self._observer)
             except AttributeError:
                 pass
 
             self._cards[index] = value
+            self._observer._set_modified()
 
     def __delitem__(self, index):
 
@@ -57,11 +59,12 @@ class CardList(object):
             self._cards[index]._unsubscribe(self._observer)
 
             if self._update_grid:
-                self._cards[index].elems.remove(self._observer)
+                self._cards[index]._remove_elem(self._observer)
         except AttributeError:
             pass
 
         del self._cards[index]
+        self._observer._set_modified()
 
     def __iadd__(self, other):
 
@@ -74,11 +77,12 @@ class CardList(object):
             value._subscribe(self._observer)
 
             if self._update_grid:
-                value.elems.add(self._observer)
+                value._add_elem(self._observer)
         except AttributeError:
             pass
 
         self._cards.append(value)
+        self._observer._set_modified()
 
     def clear(self):
 
@@ -88,11 +92,12 @@ class CardList(object):
                 card._unsubscribe(self._observer)
 
                 if self._update_grid:
-                    card.elems.remove(self._observer)
+                    card._remove_elem(self._observer)
             except AttributeError:
                 pass
 
         self._cards.clear()
+        self._observer._set_modified()
 
     def index(self, value):
         return self._cards.index(value)
@@ -1,4 +1,5 @@
 class CardSet(object):
+    __slots__ = ('_observer', '_cards', '_update_grid')
 
     def __init__(self, observer, cards=None, update_grid=False):
         self._observer = observer
@@ -38,11 +39,12 @@ class CardSet(object):
             value._subscribe(self._observer)
 
             if self._update_grid:
-                value.elems.add(self._observer)
+                value._add_elem(self._observer)
         except AttributeError:
             pass
 
         self._cards.add(value)
+        self._observer._set_modified()
 
     def remove(self, value):
 
@@ -50,11 +52,12 @@ class CardSet(object):
             value._unsubscribe(self._observer)
 
             if self._update_grid:
-                value.elems.remove(self._observer)
+                value._remove_elem(self._observer)
         except AttributeError:
             pass
 
         self._cards.remove(value)
+        self._observer._set_modified()
 
     def clear(self):
 
@@ -64,8 +67,9 @@ class CardSet(object):
                 card._unsubscribe(self._observer)
 
                 if self._update_grid:
-                    card.elems.remove(self._observer)
+                    card._remove_elem(self._observer)
             except AttributeError:
                 pass
 
         self._cards.clear()
+        self._observer._set_modified()
@@ -9,7 +9,7 @@ from nastranpy.bdf.cards.vector_card import VectorCard
 from nastranpy.bdf.cards.subscheme import Subscheme
 from nastranpy.bdf.cards.padding import Padding
 from nastranpy.bdf.cards.card_interfaces import card_interfaces
-from nastranpy.bdf.cards.card_interfaces_additional import card_interfaces_additional
+from nastranpy.bdf.cards.card_interfaces_additional import card_interfaces_additional, card_slots_additional
 from nastranpy.bdf.misc import get_singular
 
 
@@ -123,7 +123,7 @@ def class_factory(card_name, card_type, card_scheme=None, card_tag=None, card_pa
                             old_value[0]._unsubscribe(card)
 
                             if field_info.update_grid:
-                                old_value[0].elems.remove(card)
+                                old_value[0]._remove_elem(card)
                         except (TypeError, AttributeError):
                             pass
 
@@ -137,11 +137,13 @@ def class_factory(card_name, card_type, card_scheme=None, card_tag=None, card_pa
                                 vector = [value, None, None]
 
                                 if field_info.update_grid:
-                                    value.elems.add(card)
+                                    value._add_elem(card)
                             except AttributeError:
                                 pass
 
                             self.fields[index] = np.array(vector)
+
+                        card._set_modified()
                 else:
 
                     def wrapped(self, value):
@@ -163,7 +165,7 @@ def class_factory(card_name, card_type, card_scheme=None, card_tag=None, card_pa
                             old_value._unsubscribe(card)
 
                             if field_info.update_grid:
-                                old_value.elems.remove(card)
+                                old_value._remove_elem(card)
                         except AttributeError:
                             pass
 
@@ -171,16 +173,22 @@ def class_factory(card_name, card_type, card_scheme=None, card_tag=None, card_pa
                             value._subscribe(card)
 
                             if field_info.update_grid:
-                                value.elems.add(card)
+                                value._add_elem(card)
                         except AttributeError:
                             pass
 
                         self.fields[index] = value
+                        card._set_modified()
         else:
 
             def wrapped(self, value):
                 self.fields[index] = value
 
+                if is_subfield:
+                    self.card._set_modified()
+                else:
+                    self._set_modified()
+
         return wrapped
 
     def add_subscheme_factory(index, field_info):
@@ -204,6 +212,8 @@ def class_factory(card_name, card_type, card_scheme=None, card_tag=None, card_pa
             elif field_info.seq_type == 'set':
                 self.fields[index].add(subscheme)
 
+            self._set_modified()
+
         return wrapped
 
     if card_name in ('FORCE', 'MOMENT'):
@@ -221,7 +231,10 @@ def class_factory(card_name, card_type, card_scheme=None, card_tag=None, card_pa
     else:
         cls_parents = (Card,)
 
-    cls = type(card_name, cls_parents, {})
+    # Instance attributes in slots (much lighter than an instance dictionary)
+    slots = tuple(slot for cls_parent in cls_parents for slot in getattr(cls_parent, '_mixin_slots', ()))
+    slots += card_slots_additional.get(card_name, ())
+    cls = type(card_name, cls_parents, {'__slots__': slots})
     cls.type = card_type
     cls.tag = card_tag
     cls._scheme = card_scheme
@@ -241,7 +254,7 @@ def class_factory(card_name, card_type, card_scheme=None, card_tag=None, card_pa
         for index, field_info in enumerate(card_scheme):
 
             if field_info.subscheme:
-                subscheme_cls = type('{}_{}'.format(card_name, field_info.name), (Subscheme,), {})
+                subscheme_cls = type('{}_{}'.format(card_name, field_info.name), (Subscheme,), {'__slots__': ()})
                 subscheme_cls.scheme = field_info.subscheme
                 field_info.subscheme = subscheme_cls
 
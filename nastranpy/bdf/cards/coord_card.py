@@ -13,9 +13,7 @@ def update_fields(func):
             if cp:
 
                 try:
-                    self.fields[3] = cp.get_xyz(self._A)
-                    self.fields[4] = cp.get_xyz(self._B)
-                    self.fields[5] = cp.get_xyz(self._C)
+                    self.fields[3:6] = cp.get_xyz(np.array([self._A, self._B, self._C]))
                 except AttributeError:
                     pass
             else:
@@ -29,6 +27,7 @@ def update_fields(func):
 
 
 class CoordCard(Card):
+    __slots__ = ('coord_type', '_A', '_B', '_C', '_origin', '_M')
 
     def __init__(self, fields, large_field=False, free_field=False):
         super().__init__(fields, large_field=large_field, free_field=free_field)
@@ -58,14 +57,17 @@ class CoordCard(Card):
                 cp = self.fields[2]
 
                 if cp:
-                    self._A = cp.get_xyz0(self._A)
-                    self._B = cp.get_xyz0(self._B)
-                    self._C = cp.get_xyz0(self._C)
+                    self._A, self._B, self._C = cp.get_xyz0(np.array([self._A, self._B, self._C]))
         except AttributeError:
             self._log.error('Cannot settle {}'.format(repr(self)))
 
         self.compute_matrix(self._A, self._B, self._C)
 
+    def _settle_parents(self):
+        # Cards to settle first: G1A, G2A and G3A grids or RID coordinate system
+        fields = self.fields[2:5] if self.fields[0][-2] == '1' else self.fields[2:3]
+        return [field for field in fields if isinstance(field, Card)]
+
     @property
     def origin(self):
         return self._origin
@@ -95,6 +97,8 @@ class CoordCard(Card):
         self._B = B
         self._C = C
         self.compute_matrix(self._A, self._B, self._C)
+        self._set_modified()
+        self._set_child_cards_modified()
         self.changed = True
         self._notify(coord_changed=self)
 
@@ -143,6 +147,23 @@ class CoordCard(Card):
 
             if key == 'grid_changed':
                 self._settle()
+                self._set_child_cards_modified()
+
+    def _set_child_cards_modified(self):
+        # Cards defined in this coordinate system are printed with new local coordinates (those
+        # of the grids in a grid store are computed all at once, see `GridStore.update_xyz`)
+        grid_rows = dict() # {grid store: rows}
+
+        for card in self.child_cards():
+
+            if card.type == 'grid' and card.fields[2] is self and not card._store is None:
+                card._set_modified(update_store=False)
+                grid_rows.setdefault(card._store, list()).append(card._row)
+            else:
+                card._set_modified()
+
+        for grid_store, rows in grid_rows.items():
+            grid_store.update_xyz(rows, self)
 
     @update_fields
     def get_fields(self):
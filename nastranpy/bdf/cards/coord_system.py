@@ -38,6 +38,21 @@ class CoordSystem(object):
         self._M = np.array([e1, e2, e3])
 
     def get_xyz(self, xyz0, is_vector=False):
+        """
+        Get local coordinates from basic ones.
+
+        Parameters
+        ----------
+        xyz0 : array_like
+            Basic coordinates of a point (3) or several ones (n x 3).
+        is_vector : bool, optional
+            Whether or not a vector is transformed (the origin is not considered).
+
+        Returns
+        -------
+        numpy.ndarray
+            Local coordinates (same shape as `xyz0`).
+        """
 
         if not is_vector:
             xyz0 = xyz0 - self._origin
@@ -45,18 +60,33 @@ class CoordSystem(object):
         xyz = np.dot(xyz0, self._M.T)
 
         if self.coord_type == 'C':
-            return np.array(cart2cyl(*xyz))
+            return np.array(cart2cyl(*xyz.T)).T
         elif self.coord_type == 'S':
-            return np.array(cart2sph(*xyz))
+            return np.array(cart2sph(*xyz.T)).T
 
         return xyz
 
     def get_xyz0(self, xyz, is_vector=False):
+        """
+        Get basic coordinates from local ones.
+
+        Parameters
+        ----------
+        xyz : array_like
+            Local coordinates of a point (3) or several ones (n x 3).
+        is_vector : bool, optional
+            Whether or not a vector is transformed (the origin is not considered).
+
+        Returns
+        -------
+        numpy.ndarray
+            Basic coordinates (same shape as `xyz`).
+        """
 
         if self.coord_type == 'C':
-            xyz = cyl2cart(*xyz)
+            xyz = np.array(cyl2cart(*np.asarray(xyz).T)).T
         elif self.coord_type == 'S':
-            xyz = sph2cart(*xyz)
+            xyz = np.array(sph2cart(*np.asarray(xyz).T)).T
 
         if is_vector:
             return np.dot(xyz, self._M)
@@ -64,6 +94,8 @@ class CoordSystem(object):
             return self._origin + np.dot(xyz, self._M)
 
 
+# Conversions of single points (floats) or several ones (arrays of each coordinate)
+
 def cart2cyl(x, y, z):
     theta = np.arctan2(y, x)
     rho = np.hypot(x, y)
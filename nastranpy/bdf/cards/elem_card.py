@@ -3,14 +3,32 @@ from nastranpy.bdf.cards.filters import filter_factory
 
 
 class ElemCard(Card):
+    __slots__ = ('_coord', '_table', '_row')
 
     def __init__(self, fields, large_field=False, free_field=False):
         super().__init__(fields, large_field=large_field, free_field=free_field)
         self._coord = None
+        self._table = None # Connectivity table (see `ConnectivityTable`)
+        self._row = None
+
+    def _process_fields(self, items=None):
+        super()._process_fields(items)
+
+        if not self._table is None:
+            self._table.update(self)
+
+    def _set_modified(self):
+        super()._set_modified()
+
+        if not self._table is None:
+            self._table.update(self)
 
     def _settle(self):
         pass
 
+    def _unsettle(self):
+        self._coord = None
+
     @property
     def coord(self):
 
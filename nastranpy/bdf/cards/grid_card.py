@@ -1,4 +1,5 @@
 import numpy as np
+from nastranpy.bdf.observable import add_item, remove_item
 from nastranpy.bdf.cards.card import Card
 from nastranpy.bdf.cards.filters import filter_factory
 
@@ -10,64 +11,141 @@ def update_fields(func):
         if self._is_processed:
             self.fields[3] = self.xyz
 
+            if not self._store is None:
+
+                try:
+                    return func(self)
+                finally:
+                    self.fields[3] = None # Coordinates are only kept in the grid store
+
         return func(self)
 
     return wrapped
 
 
 class GridCard(Card):
+    __slots__ = ('_xyz0', '_elems', '_store', '_row')
 
     def __init__(self, fields, large_field=False, free_field=False):
         super().__init__(fields, large_field=large_field, free_field=free_field)
-        self._xyz0 = None
-        self.elems = set()
+        self._xyz0 = None # Only used while not in a grid store
+        self._elems = () # Elements attached (a tuple while only a few, see `add_item`)
+        self._store = None # Grid store keeping the coordinates (see `GridStore`)
+        self._row = None
 
     @update_fields
     def __str__(self):
         return super().__str__()
 
+    def _process_fields(self, items=None):
+        super()._process_fields(items)
+
+        if not self._store is None:
+            # Basic coordinates are settled again from the new local ones
+            self._store.set_xyz(self._row, self.fields[3])
+            self._store.set_xyz0(self._row, None)
+            self.fields[3] = None
+            self._store.update(self)
+
+    def _set_modified(self, update_store=True):
+        super()._set_modified()
+
+        if update_store and not self._store is None and self._is_processed:
+            self._store.update(self)
+
+    def _get_xyz(self):
+        # Local coordinates as defined (not derived from the basic ones)
+
+        if self._store is None:
+            return self.fields[3]
+        else:
+            return self._store.get_xyz(self._row)
+
+    def _set_xyz0(self, value):
+
+        if self._store is None:
+            self._xyz0 = value
+        else:
+            self._store.set_xyz0(self._row, value)
+
+    def _is_settled(self):
+
+        if self._store is None:
+            return not self._xyz0 is None
+        else:
+            return self._store.is_settled(self._row)
+
     def _settle(self):
 
-        if self._xyz0 is None:
+        if not self._is_settled():
             cp = self.fields[2]
 
             if cp:
 
                 try:
-                    self._xyz0 = cp.get_xyz0(self.fields[3])
+                    self._set_xyz0(cp.get_xyz0(self._get_xyz()))
                 except AttributeError:
                     self._log.error('Cannot settle {}'.format(repr(self)))
             else:
-                self._xyz0 = self.fields[3]
+                self._set_xyz0(self._get_xyz())
+
+    def _settle_parents(self):
+        # Cards to settle first: CP coordinate system
+        cp = self.fields[2]
+        return [cp] if isinstance(cp, Card) else []
+
+    def _unsettle(self):
+        self._set_xyz0(None)
+
+    @property
+    def elems(self):
+        return self._elems
+
+    def _add_elem(self, elem):
+        self._elems = add_item(self._elems, elem)
+
+    def _remove_elem(self, elem):
+        self._elems = remove_item(self._elems, elem)
 
     @property
     def xyz0(self):
-        return self._xyz0
+
+        if self._store is None:
+            return self._xyz0
+        else:
+            return self._store.get_xyz0(self._row)
 
     @xyz0.setter
     def xyz0(self, value):
 
-        if not np.allclose(self._xyz0, value):
-            self._xyz0 = value
+        if not np.allclose(self.xyz0, value):
+            self._set_xyz0(value)
+            self._set_modified()
             self.changed = True
             self._notify(grid_changed=self)
 
     @property
     def xyz(self):
+        xyz0 = self.xyz0
 
-        if self._xyz0 is None:
-            return self.fields[3]
+        if xyz0 is None:
+            return self._get_xyz()
 
         cp = self.fields[2]
 
         if cp:
-            return cp.get_xyz(self._xyz0)
+            return cp.get_xyz(xyz0)
         else:
-            return self._xyz0
+            return xyz0
 
     @xyz.setter
     def xyz(self, value):
-        self.fields[3] = value
+
+        if self._store is None:
+            self.fields[3] = value
+        else:
+            self._store.set_xyz(self._row, value)
+
         cp = self.fields[2]
 
         if cp:
@@ -1,6 +1,8 @@
+import locale
 from nastranpy.bdf.cards.card import Card
 from nastranpy.bdf.cards.card_interfaces import item_types, set_types, sorted_cards
-from nastranpy.bdf.misc import get_plural, get_id_info, assure_path_exists
+from nastranpy.bdf.write_bdf import print_cards, write_chunks
+from nastranpy.bdf.misc import get_plural, get_id_info, assure_path_exists, open_bdf
 
 
 def iter_items_factory(card_type):
@@ -12,12 +14,15 @@ def iter_items_factory(card_type):
 
 
 class IncludeCard(Card):
+    __slots__ = ('_file', 'id_pattern', '_stamp', 'is_modified', 'cards', 'commentted_cards')
 
     def __init__(self, fields, large_field=False, free_field=False):
         fields[1] = fields[1].replace("'", "")
         super().__init__(fields, large_field=large_field, free_field=free_field)
         self._file = fields[1]
         self.id_pattern = None
+        self._stamp = None
+        self.is_modified = False
         self.clear()
 
     def clear(self):
@@ -42,6 +47,9 @@ class IncludeCard(Card):
             self._notify(new_include_name=value)
             self._file = value
             self.fields[1] = value
+            self.is_modified = True
+            self._is_edited = True
+            self._set_modified()
 
     def print(self, *args, **kwargs):
         return "INCLUDE '{}'".format('\n         '.join([self._file[i:i+62] for i in
@@ -51,21 +59,43 @@ class IncludeCard(Card):
         ids = {card.id for card in self.cards if card.type == card_type}
         return get_id_info(ids, detailed=detailed)
 
-    def write(self):
+    def write(self, source=None):
+        """
+        Write the include file.
+
+        Parameters
+        ----------
+        source : tuple, optional
+            Card records of the include file as readed (as returned by
+            `scan_records`). Cards not edited since then are copied verbatim from
+            it and keep their order in the file, the rest are printed (the default
+            is None, which implies all cards are printed).
+        """
         assure_path_exists(self._file)
 
         if self.commentted_cards or self.cards:
+            cards = sorted_cards(self.cards)
 
-            with open(self._file, 'w') as f:
+            if source:
+                # Line endings of the file as readed are kept (records are copied as they are)
+                newline = '\r\n' if b'\r\n' in source[0] else '\n'
+                card_chunks = source_chunks(cards, *source, newline=newline)
+            else:
+                newline = '\n'
+                card_chunks = (card + '\n' for card in print_cards(cards, print_comment=True))
 
-                for card in sorted_cards(self.commentted_cards):
-                    f.write(card.print(print_comment=True, is_commented=True, comment_symbol='$ -> ') + '\n')
+            with open_bdf(self._file, 'w', newline='' if source else None) as f:
+                write_chunks(f, (card.replace('\n', newline) + newline for
+                                 card in print_cards(sorted_cards(self.commentted_cards), print_comment=True,
+                                                     is_commented=True, comment_symbol='$ -> ')))
+                write_chunks(f, card_chunks)
 
-                for card in sorted_cards(self.cards):
-                    f.write(card.print(print_comment=True) + '\n')
+            for card in cards:
+                card._is_edited = False
 
     def clear_commented_cards(self):
         self.commentted_cards.clear()
+        self.is_modified = True
 
     def is_self_contained(self):
         return all((parent_card in self.cards or
@@ -88,11 +118,131 @@ class IncludeCard(Card):
 
         if not move_cards:
             self.commentted_cards = cards2add
+            self.is_modified = True
         else:
 
             for card in cards2add:
                 card.include = self
 
 
+def card_key(card):
+    """
+    Get the key of a card matching its record in an include file (see
+    `record_keys`).
+    """
+    return card.name, card.file if card.type == 'include' else card.id
+
+
+def record_keys(include_ids):
+    """
+    Get the keys of the card records of an include file: (card_name, card_id), or
+    ('INCLUDE', file) for INCLUDE cards. `card_id` is a str for cards without an
+    integer id (i.e. ('PARAM', 'POST')).
+
+    Parameters
+    ----------
+    include_ids : IncludeIds
+        Card ids of the file.
+
+    Returns
+    -------
+    list of tuple
+        Keys in the order of the records.
+    """
+    includes = iter(include_ids.includes)
+    str_ids = include_ids.str_ids
+    return [(card_name, next(includes).replace("'", "") if card_name == 'INCLUDE' else
+             str_ids.get(index, card_id)) for
+            index, (card_name, card_id) in enumerate(zip(include_ids.names.tolist(), include_ids.ids.tolist()))]
+
+
+def source_chunks(cards, contents, include_ids, starts, ends, encoding=None, newline='\n'):
+    """
+    Get the text of the cards of an include file, copying the records of the cards
+    not edited since the file was readed.
+
+    Cards are arranged in the order of their records in the file, followed by the
+    cards without a record (i.e. created or moved in). Cards whose name and id
+    appear more than once in the file are always printed.
+
+    Parameters
+    ----------
+    cards : list of Card
+        Cards of the include file.
+    contents : bytes
+        Contents of the file as readed.
+    include_ids : IncludeIds
+        Card ids of the file as readed.
+    starts, ends : numpy.ndarray of int
+        Byte span of each card record.
+    encoding : str, optional
+        File encoding (the default is None, which implies the same encoding used by
+        `open` in text mode).
+    newline : str, optional
+        Line ending of the printed cards (copied records keep their own ones, so
+        the chunks are meant to be written without newline translation).
+
+    Yields
+    ------
+    str
+        Text of one or more consecutive cards (new lines included).
+    """
+
+    if not encoding:
+        encoding = locale.getpreferredencoding(False)
+
+    records = dict() # {(card_name, card_id): record index}
+    repeated_keys = set()
+
+    for index, key in enumerate(record_keys(include_ids)):
+
+        if key in records:
+            repeated_keys.add(key)
+        else:
+            records[key] = index
+
+    located_cards = list()
+    other_cards = list()
+
+    for card in cards:
+        key = card_key(card)
+
+        if key in records:
+            located_cards.append((records[key], not key in repeated_keys, card))
+        else:
+            other_cards.append(card)
+
+    located_cards.sort(key=lambda x: x[0])
+    starts = starts.tolist()
+    ends = ends.tolist()
+    chunks = list() # [(start, end) of consecutive records or list of cards to print, ...]
+
+    for index, is_unique, card in located_cards:
+
+        if is_unique and not card._is_edited and not card.is_commented:
+
+            if chunks and isinstance(chunks[-1], tuple) and chunks[-1][1] == starts[index]:
+                chunks[-1] = (chunks[-1][0], ends[index])
+            else:
+                chunks.append((starts[index], ends[index]))
+
+        else:
+
+            if chunks and isinstance(chunks[-1], list):
+                chunks[-1].append(card)
+            else:
+                chunks.append([card])
+
+    chunks.append(other_cards)
+
+    for chunk in chunks:
+
+        if isinstance(chunk, tuple):
+            text = contents[chunk[0]:chunk[1]].decode(encoding)
+            yield text if text.endswith('\n') else text + newline
+        else:
+            yield from (card.replace('\n', newline) + newline for card in print_cards(chunk, print_comment=True))
+
+
 for card_type in list(item_types) + list(set_types):
     setattr(IncludeCard, get_plural(card_type), iter_items_factory(card_type))
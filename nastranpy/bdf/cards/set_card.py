@@ -2,6 +2,7 @@ from nastranpy.bdf.cards.card import Card
 
 
 class SetCard(Card):
+    __slots__ = ('_set',)
 
     def __init__(self, fields, large_field=False, free_field=False):
         super().__init__(fields, large_field=large_field, free_field=free_field)
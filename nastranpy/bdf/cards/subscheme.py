@@ -3,6 +3,7 @@ from nastranpy.bdf.cards.card_set import CardSet
 
 
 class Subscheme(object):
+    __slots__ = ('fields', 'card')
     scheme = None
 
     def __init__(self, fields, card):
@@ -51,7 +52,7 @@ class Subscheme(object):
                         field._subscribe(card)
 
                         if field_info.update_grid:
-                            field.elems.add(card)
+                            field._add_elem(card)
                     except AttributeError:
                         pass
 
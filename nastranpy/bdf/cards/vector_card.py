@@ -22,6 +22,10 @@ def update_fields(func):
 
 
 class VectorCard(Card):
+    # VectorCard is combined with SetCard (FORCE and MOMENT cards), so its attributes are stored in
+    # the slots of the card classes (see `class_factory`)
+    __slots__ = ()
+    _mixin_slots = ('_vector0',)
 
     def __init__(self, fields, large_field=False, free_field=False):
         super().__init__(fields, large_field=large_field, free_field=free_field)
@@ -44,6 +48,9 @@ class VectorCard(Card):
             else:
                 self._vector0 = self._vector * self._scale_factor
 
+    def _unsettle(self):
+        self._vector0 = None
+
     @property
     def vector0(self):
 
@@ -55,6 +62,7 @@ class VectorCard(Card):
     @vector0.setter
     def vector0(self, value):
         self._vector0 = value
+        self._set_modified()
 
     @update_fields
     def get_fields(self):
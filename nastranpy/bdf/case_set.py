@@ -2,6 +2,7 @@ from nastranpy.bdf.observable import Observable
 
 
 class CaseSet(Observable):
+    __slots__ = ('_id', '_type', 'cards')
 
     def __init__(self, id, type):
         super().__init__()
@@ -32,6 +33,7 @@ class CaseSet(Observable):
 
             for card in self.cards:
                 card.fields[1] = int(value)
+                card._set_modified()
 
     @property
     def type(self):
@@ -0,0 +1,250 @@
+import numpy as np
+
+
+def table_width(card_scheme):
+    """
+    Get the number of grids of the elements of a card scheme.
+
+    Parameters
+    ----------
+    card_scheme : list of FieldInfo
+        Card scheme.
+
+    Returns
+    -------
+    int or None
+        Maximum number of grids (None if not fixed, i.e. grid sets or grids in
+        subschemes).
+    """
+    width = 0
+
+    for field_info in card_scheme:
+
+        if field_info.subscheme:
+
+            if any(subfield_info.update_grid for subfield_info in field_info.subscheme.scheme):
+                return None
+
+        elif field_info.update_grid:
+
+            if field_info.seq_type == 'list' and field_info.length:
+                width += field_info.length
+            elif field_info.seq_type:
+                return None
+            else:
+                width += 1
+
+    return width
+
+
+class ConnectivityTable(object):
+
+    def __init__(self, card_name, grid_store, width=None, capacity=1024):
+        """
+        Initialize a ConnectivityTable instance (the grids of the elements of a card
+        name stored as rows of the grid store, see `GridStore`).
+
+        Elements with a fixed number of grids (i.e. CQUAD4) are stored in a dense
+        table (n x width, -1 for blank or unknown grids). Otherwise (i.e. RBE2 or
+        RBE3) grids are stored in a compressed sparse row layout: the grids of
+        element `i` are `grid_rows[offsets[i]:offsets[i + 1]]`.
+
+        Elements are flagged when edited (see `update`) and their rows are computed
+        again the next time the table is accessed.
+
+        Parameters
+        ----------
+        card_name : str
+            Element card name.
+        grid_store : GridStore
+            Grid store of the model.
+        width : int, optional
+            Number of grids of each element (the default is None, which implies
+            the compressed sparse row layout is used).
+        capacity : int, optional
+            Initial number of rows of a dense table (it grows as needed).
+
+        Examples
+        --------
+        Centroids of all the CQUAD4 elements:
+        >>> table = model.connectivity('CQUAD4')
+        >>> centroids = model.grid_store.xyz0[table.grid_rows].mean(axis=1)
+        """
+        self.name = card_name
+        self.width = width
+        self.index = dict() # {element id: row}
+        self.elems = list() # Element card of each row
+        self._grid_store = grid_store
+        self._ids = np.zeros(capacity, dtype=np.int64)
+        self._stale_rows = set()
+
+        if width is None:
+            self._grid_rows = np.zeros(0, dtype=np.int32)
+            self._offsets = np.zeros(1, dtype=np.int64)
+        else:
+            self._grid_rows = np.full((capacity, width), -1, dtype=np.int32)
+            self._offsets = None
+
+    def __repr__(self):
+        return '<ConnectivityTable: {} {} elements>'.format(len(self), self.name)
+
+    def __len__(self):
+        return len(self.elems)
+
+    @property
+    def ids(self):
+        return self._ids[:len(self.elems)]
+
+    @property
+    def grid_rows(self):
+        self._refresh()
+
+        if self.width is None:
+            return self._grid_rows
+        else:
+            return self._grid_rows[:len(self.elems)]
+
+    @property
+    def offsets(self):
+        self._refresh()
+        return self._offsets
+
+    def add(self, elem):
+        """
+        Add an element (its grids are computed as soon as the table is accessed).
+
+        Parameters
+        ----------
+        elem : ElemCard
+            Element card.
+        """
+        row = len(self.elems)
+
+        if row == len(self._ids):
+            self._grow()
+
+        self.elems.append(elem)
+        self._ids[row] = elem.fields[1]
+        self.index[elem.fields[1]] = row
+        elem._table = self
+        elem._row = row
+        self._stale_rows.add(row)
+
+    def remove(self, elem):
+        """
+        Remove an element (the last row is moved to its one).
+
+        Parameters
+        ----------
+        elem : ElemCard
+            Element card.
+        """
+        row = elem._row
+
+        if self.index.get(self._ids[row]) == row:
+            del self.index[self._ids[row]]
+
+        last_row = len(self.elems) - 1
+
+        if row != last_row:
+            last_elem = self.elems[last_row]
+            self._ids[row] = self._ids[last_row]
+            self.elems[row] = last_elem
+            last_elem._row = row
+
+            if self.index.get(self._ids[row]) == last_row:
+                self.index[self._ids[row]] = row
+
+            if self.width is None:
+                self._stale_rows.add(row)
+            else:
+                self._grid_rows[row] = self._grid_rows[last_row]
+
+                if last_row in self._stale_rows:
+                    self._stale_rows.add(row)
+
+        self.elems.pop()
+        self._stale_rows.discard(last_row)
+        self._ids[last_row] = 0
+
+        if self.width is None:
+            self._stale_rows.add(0) # Offsets must be computed again anyway
+        else:
+            self._grid_rows[last_row] = -1
+
+        elem._table = None
+        elem._row = None
+
+    def update(self, elem):
+        """
+        Flag an element as edited (renumbered, its grids changed or moved to other
+        rows of the grid store).
+
+        Parameters
+        ----------
+        elem : ElemCard
+            Element card.
+        """
+        row = elem._row
+        elem_id = elem.fields[1]
+
+        if self.index.get(elem_id) != row: # Renumbered element
+            old_id = int(self._ids[row])
+
+            if self.index.get(old_id) == row:
+                del self.index[old_id]
+
+            self._ids[row] = elem_id
+            self.index[elem_id] = row
+
+        self._stale_rows.add(row)
+
+    def _get_grid_rows(self, elem):
+        # Rows of the grids of an element in card order (None for blank grids)
+        grid_rows = list()
+
+        for field, field_info, _ in elem._get_fields():
+
+            if field_info and field_info.update_grid:
+
+                if field is None:
+                    grid_rows.append(None)
+                elif getattr(field, '_store', None) is self._grid_store:
+                    grid_rows.append(field._row)
+                else: # Not linked
+                    grid_rows.append(self._grid_store.index.get(field, -1))
+
+        return grid_rows
+
+    def _refresh(self):
+
+        if not self._stale_rows:
+            return
+
+        if self.width is None:
+            grid_rows = [[grid_row for grid_row in self._get_grid_rows(elem) if not grid_row is None] for
+                         elem in self.elems]
+            self._offsets = np.zeros(len(grid_rows) + 1, dtype=np.int64)
+            np.cumsum([len(elem_grid_rows) for elem_grid_rows in grid_rows], out=self._offsets[1:])
+            self._grid_rows = np.array([grid_row for elem_grid_rows in grid_rows for grid_row in elem_grid_rows],
+                                       dtype=np.int32)
+        else:
+
+            for row in self._stale_rows:
+                grid_rows = [-1 if grid_row is None else grid_row for
+                             grid_row in self._get_grid_rows(self.elems[row])][:self.width]
+                self._grid_rows[row] = -1
+                self._grid_rows[row, :len(grid_rows)] = grid_rows
+
+        self._stale_rows.clear()
+
+    def _grow(self):
+        capacity = 2 * len(self._ids)
+        ids = np.zeros(capacity, dtype=np.int64)
+        ids[:len(self._ids)] = self._ids
+        self._ids = ids
+
+        if not self.width is None:
+            grid_rows = np.full((capacity, self.width), -1, dtype=np.int32)
+            grid_rows[:len(self._grid_rows)] = self._grid_rows
+            self._grid_rows = grid_rows
@@ -0,0 +1,317 @@
+import math
+import numpy as np
+
+
+def coord_id(field):
+    # Coordinate system id of a CP/CD field (linked card, id or blank)
+
+    try:
+        return field.id
+    except AttributeError:
+        return field or 0
+
+
+class GridStore(object):
+
+    def __init__(self, capacity=1024):
+        """
+        Initialize a GridStore instance (the grids of a model stored by columns).
+
+        Each grid card added is given a row of the store, where its coordinates
+        are kept from then on (`GridCard` objects read and write them there). Rows
+        are kept contiguous: the last row is moved to the one of a grid removed.
+        Grids not built yet in a lazy read are not stored (see `Model.materialize`).
+
+        The columns are exposed as NumPy views of the rows in use (no copies):
+
+        ids : numpy.ndarray of int
+            Grid ids.
+        cp, cd : numpy.ndarray of int
+            Coordinate system ids (0 if blank).
+        xyz : numpy.ndarray of float
+            Coordinates in the CP coordinate system (n x 3).
+        xyz0 : numpy.ndarray of float
+            Coordinates in the basic coordinate system (n x 3, NaN if not known
+            yet, i.e. the grid is not linked to its coordinate system).
+
+        Parameters
+        ----------
+        capacity : int, optional
+            Initial number of rows (the store grows as needed).
+
+        Examples
+        --------
+        Distance of all the grids to the origin:
+        >>> np.linalg.norm(model.grid_store.xyz0, axis=1)
+
+        Coordinates of some grids:
+        >>> model.grid_store.xyz0[model.grid_store.rows([1001, 1002, 1003])]
+        """
+        self.index = dict() # {grid id: row}
+        self.grids = list() # Grid card of each row
+        self._ids = np.zeros(capacity, dtype=np.int64)
+        self._cp = np.zeros(capacity, dtype=np.int64)
+        self._cd = np.zeros(capacity, dtype=np.int64)
+        self._xyz = np.full((capacity, 3), np.nan)
+        self._xyz0 = np.full((capacity, 3), np.nan)
+
+    def __repr__(self):
+        return '<GridStore: {} grids>'.format(len(self))
+
+    def __len__(self):
+        return len(self.grids)
+
+    @property
+    def ids(self):
+        return self._ids[:len(self.grids)]
+
+    @property
+    def cp(self):
+        return self._cp[:len(self.grids)]
+
+    @property
+    def cd(self):
+        return self._cd[:len(self.grids)]
+
+    @property
+    def xyz(self):
+        return self._xyz[:len(self.grids)]
+
+    @property
+    def xyz0(self):
+        return self._xyz0[:len(self.grids)]
+
+    def rows(self, grid_ids):
+        """
+        Get the rows of several grids.
+
+        Parameters
+        ----------
+        grid_ids : iterable of int
+            Grid ids.
+
+        Returns
+        -------
+        numpy.ndarray of int
+            Rows.
+        """
+        return np.array([self.index[grid_id] for grid_id in grid_ids], dtype=np.int64)
+
+    def add(self, grid):
+        """
+        Store a grid (its coordinates are moved to a new row).
+
+        Parameters
+        ----------
+        grid : GridCard
+            Grid card.
+        """
+        row = len(self.grids)
+
+        if row == len(self._ids):
+            self._grow()
+
+        self.grids.append(grid)
+        self._ids[row] = grid.fields[1]
+        self.index[grid.fields[1]] = row
+        grid._store = self
+        grid._row = row
+
+        if grid._is_processed:
+            self.set_xyz(row, grid.fields[3])
+            self.set_xyz0(row, grid._xyz0)
+            grid.fields[3] = None
+            grid._xyz0 = None
+            self.update(grid)
+
+    def remove(self, grid):
+        """
+        Remove a grid from the store (its coordinates are moved back to it).
+
+        Parameters
+        ----------
+        grid : GridCard
+            Grid card.
+        """
+        row = grid._row
+
+        if grid._is_processed:
+            grid.fields[3] = self.get_xyz(row)
+            grid._xyz0 = self.get_xyz0(row)
+
+        if self.index.get(self._ids[row]) == row:
+            del self.index[self._ids[row]]
+
+        last_row = len(self.grids) - 1
+
+        if row != last_row:
+            last_grid = self.grids[last_row]
+            self._ids[row] = self._ids[last_row]
+            self._cp[row] = self._cp[last_row]
+            self._cd[row] = self._cd[last_row]
+            self._xyz[row] = self._xyz[last_row]
+            self._xyz0[row] = self._xyz0[last_row]
+            self.grids[row] = last_grid
+            last_grid._row = row
+
+            # Connectivity of the elements attached to the grid moved
+            for elem in last_grid.elems:
+
+                try:
+                    elem._table.update(elem)
+                except AttributeError: # Not in a connectivity table
+                    pass
+
+            if self.index.get(self._ids[row]) == last_row:
+                self.index[self._ids[row]] = row
+
+        self.grids.pop()
+        self._ids[last_row] = 0
+        self._cp[last_row] = 0
+        self._cd[last_row] = 0
+        self._xyz[last_row] = np.nan
+        self._xyz0[last_row] = np.nan
+        grid._store = None
+        grid._row = None
+
+    def update(self, grid):
+        """
+        Update the id, coordinate systems and local coordinates of a stored grid
+        (i.e. once renumbered, edited or its coordinate system changed).
+
+        Parameters
+        ----------
+        grid : GridCard
+            Grid card.
+        """
+        row = grid._row
+        grid_id = grid.fields[1]
+
+        if self.index.get(grid_id) != row: # New or renumbered grid
+            old_id = int(self._ids[row])
+
+            if self.index.get(old_id) == row:
+                del self.index[old_id]
+
+            self._ids[row] = grid_id
+            self.index[grid_id] = row
+
+        if grid._is_processed:
+            self._cp[row] = coord_id(grid.fields[2])
+            self._cd[row] = coord_id(grid.fields[4])
+
+            # Local coordinates of settled grids are derived from the basic ones
+            if self.is_settled(row):
+                self._xyz[row] = grid.xyz
+
+    def settle(self, grids):
+        """
+        Compute the basic coordinates of several grids (those not settled yet).
+
+        The grids are grouped by CP coordinate system, so each one transforms all
+        its grids at once.
+
+        Parameters
+        ----------
+        grids : iterable of GridCard
+            Grid cards (those not in the store are settled one by one).
+        """
+        coord_rows = dict() # {CP coordinate system: rows}
+
+        for grid in grids:
+
+            if grid._store is self:
+                coord_rows.setdefault(grid.fields[2] or None, list()).append(grid._row)
+            else:
+                grid._settle()
+
+        for cp, rows in coord_rows.items():
+            rows = np.array(rows, dtype=np.int64)
+            rows = rows[np.isnan(self._xyz0[rows, 0])]
+
+            if cp:
+
+                try:
+                    self._xyz0[rows] = cp.get_xyz0(self._xyz[rows])
+                except AttributeError: # Not linked or not settled (errors are logged by each grid)
+
+                    for row in rows:
+                        self.grids[row]._settle()
+
+            else:
+                self._xyz0[rows] = self._xyz[rows]
+
+    def xyz_in(self, coord=None, rows=None):
+        """
+        Get the coordinates of the grids in a coordinate system (all of them
+        transformed at once).
+
+        Parameters
+        ----------
+        coord : CoordCard, optional
+            Coordinate system (the default is None, which implies the basic one).
+        rows : array_like of int, optional
+            Rows of the grids (the default is None, which implies all of them).
+
+        Returns
+        -------
+        numpy.ndarray of float
+            Coordinates (n x 3, NaN for grids not settled).
+
+        Examples
+        --------
+        >>> model.grid_store.xyz_in(model.coords[10], model.grid_store.rows([1001, 1002]))
+        """
+        xyz0 = self.xyz0 if rows is None else self.xyz0[rows]
+
+        if coord:
+            return coord.get_xyz(xyz0)
+        else:
+            return xyz0.copy()
+
+    def update_xyz(self, rows, coord=None):
+        """
+        Update the local coordinates of several grids from their basic ones (i.e.
+        once their CP coordinate system changed), all of them at once.
+
+        Parameters
+        ----------
+        rows : array_like of int
+            Rows of the grids (those not settled are left untouched).
+        coord : CoordCard, optional
+            CP coordinate system of the grids (the default is None, which implies
+            the basic one).
+        """
+        rows = np.array(rows, dtype=np.int64)
+        rows = rows[~np.isnan(self._xyz0[rows, 0])]
+        self._xyz[rows] = self.xyz_in(coord, rows)
+
+    def is_settled(self, row):
+        return not math.isnan(self._xyz0[row, 0])
+
+    def get_xyz(self, row):
+        xyz = self._xyz[row]
+        return None if math.isnan(xyz[0]) else xyz.copy()
+
+    def set_xyz(self, row, value):
+        self._xyz[row] = np.nan if value is None else value
+
+    def get_xyz0(self, row):
+        xyz0 = self._xyz0[row]
+        return None if math.isnan(xyz0[0]) else xyz0.copy()
+
+    def set_xyz0(self, row, value):
+        self._xyz0[row] = np.nan if value is None else value
+
+    def _grow(self):
+        capacity = 2 * len(self._ids)
+
+        for name in ('_ids', '_cp', '_cd', '_xyz', '_xyz0'):
+            column = getattr(self, name)
+            new_column = np.zeros((capacity,) + column.shape[1:], dtype=column.dtype)
+
+            if column.dtype.kind == 'f':
+                new_column[:] = np.nan
+
+            new_column[:len(column)] = column
+            setattr(self, name, new_column)
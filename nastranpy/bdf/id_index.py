@@ -0,0 +1,477 @@
+import os
+import mmap
+import pickle
+import hashlib
+import locale
+from contextlib import nullcontext
+import numpy as np
+from nastranpy.bdf.misc import file_stamp, is_compressed, open_bdf
+from nastranpy.bdf.read_bdf import get_card_name_id, fields_in_lines, mmap_lines
+from nastranpy.bdf.cards.card_factory import card_factory
+
+
+class IncludeIds(object):
+
+    def __init__(self, file, names, ids, offsets, line_counts, includes, str_ids=None):
+        """
+        Initialize an IncludeIds instance (the ids of the cards in an include file).
+
+        Parameters
+        ----------
+        file : str
+            Include file path.
+        names : numpy.ndarray of str
+            Card names.
+        ids : numpy.ndarray of int
+            Card ids (-1 for cards without an integer id).
+        offsets : numpy.ndarray of int
+            Byte offset of the first line of each card.
+        line_counts : numpy.ndarray of int
+            Number of lines of each card (up to the next card, comments included).
+        includes : list of str
+            Nested include files (as written in the INCLUDE cards).
+        str_ids : dict, optional
+            Ids of the cards whose id is not an integer, i.e. PARAM cards, or blank
+            (None) ({card index: card id}).
+        """
+        self.file = file
+        self.names = names
+        self.ids = ids
+        self.offsets = offsets
+        self.line_counts = line_counts
+        self.includes = includes
+        self.str_ids = str_ids or dict()
+
+    def __repr__(self):
+        return "<IncludeIds '{}': {} cards>".format(self.file, len(self))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _mask(self, keys):
+
+        if not keys:
+            return self.ids >= 0
+
+        keys = set(keys)
+        names = [name for name in np.unique(self.names) if
+                 name in keys or card_factory.names2types.get(name) in keys]
+        return np.isin(self.names, names) & (self.ids >= 0)
+
+    def card_ids(self, keys=None):
+        """
+        Get the ids of the cards in the file.
+
+        Parameters
+        ----------
+        keys : list of str, optional
+            Card names and/or types (i.e. ['GRID', 'elem']) of the cards (the
+            default is None, which implies all the cards with an integer id).
+
+        Returns
+        -------
+        numpy.ndarray of int
+            Card ids (in file order).
+        """
+        return self.ids[self._mask(keys)]
+
+    def find_card(self, card_name, card_id):
+        """
+        Locate a card in the file.
+
+        Parameters
+        ----------
+        card_name : str
+            Card name or type (i.e. 'GRID' or 'elem').
+        card_id : int
+            Card id.
+
+        Returns
+        -------
+        int or None
+            Byte offset of the first line of the card (None if it is not in the
+            file).
+        """
+        index = np.flatnonzero((self.ids == card_id) & self._mask([card_name]))
+
+        if len(index):
+            return int(self.offsets[index[0]])
+
+
+    def fields(self, card_names=None):
+        """
+        Get the ids of the cards in the file as `fields_in_file` would do it with
+        `only_ids` set to True (cards without an integer id are skipped).
+
+        Parameters
+        ----------
+        card_names : set of str, optional
+            Card names to get (the default is None, which implies all the cards).
+
+        Yields
+        -------
+        tuple
+            (fields, is_large_field, is_free_field, comment). Fields are [card_name
+            (str), card_id (int)] (except for INCLUDE cards).
+        """
+        includes = iter(self.includes)
+        selected = self._mask(card_names) | (self.names == 'INCLUDE')
+
+        for card_name, card_id in zip(self.names[selected].tolist(), self.ids[selected].tolist()):
+
+            if card_name == 'INCLUDE':
+                yield ['INCLUDE', next(includes)], False, False, ''
+            else:
+                yield [card_name, card_id], False, False, ''
+
+
+class IdIndex(object):
+    version = 3
+
+    def __init__(self, path=None):
+        """
+        Initialize an index of the card ids in include files.
+
+        The ids of each include file (see `IncludeIds`) are stored in a sidecar file
+        when it is scanned for the first time, and reused while the include file
+        keeps the same size and modification time.
+
+        Parameters
+        ----------
+        path : str, optional
+            Directory of the sidecar files (the default is None, which implies each
+            sidecar file is stored next to its include file, i.e. '.mesh.bdf.ids' for
+            'mesh.bdf').
+        """
+        self.path = path
+
+    def _sidecar_file(self, file):
+
+        if self.path:
+            key = os.path.abspath(file)
+            return os.path.join(self.path, hashlib.sha1(key.encode()).hexdigest() + '.ids')
+
+        return os.path.join(os.path.dirname(file), '.' + os.path.basename(file) + '.ids')
+
+    def get(self, file):
+        """
+        Get the card ids of an include file (nested includes are not followed).
+
+        Parameters
+        ----------
+        file : str
+            Include file path.
+
+        Returns
+        -------
+        IncludeIds
+        """
+        stamp = file_stamp(file)
+        sidecar_file = self._sidecar_file(file)
+
+        try:
+
+            with open(sidecar_file, 'rb') as f:
+                indexed = pickle.load(f)
+
+            if indexed['version'] == self.version and indexed['stamp'] == stamp:
+                return IncludeIds(file, *indexed['ids'])
+
+        except (OSError, EOFError, pickle.UnpicklingError, KeyError, TypeError):
+            pass
+
+        include_ids = scan_ids(file)
+        indexed = {
+            'version': self.version,
+            'file': os.path.abspath(file),
+            'stamp': stamp,
+            'ids': (include_ids.names, include_ids.ids, include_ids.offsets,
+                    include_ids.line_counts, include_ids.includes, include_ids.str_ids),
+        }
+
+        try:
+            os.makedirs(os.path.dirname(sidecar_file) or '.', exist_ok=True)
+
+            with open(sidecar_file + '.tmp', 'wb') as f:
+                pickle.dump(indexed, f, pickle.HIGHEST_PROTOCOL)
+
+            os.replace(sidecar_file + '.tmp', sidecar_file)
+        except OSError: # i.e. read-only directory
+            pass
+
+        return include_ids
+
+    def walk(self, files, logger=None):
+        """
+        Get the card ids of several include files, following nested includes.
+
+        Parameters
+        ----------
+        files : list of str
+            Include file paths.
+        logger : Logger Object
+
+        Yields
+        -------
+        IncludeIds
+        """
+
+        def walk(file):
+            include_ids = self.get(file)
+            yield include_ids
+
+            for include in include_ids.includes:
+
+                try:
+                    yield from walk(os.path.join(os.path.dirname(file), include))
+                except FileNotFoundError:
+
+                    if logger:
+                        logger.warning("No such file: '{}'".format(include))
+                    else:
+                        raise
+
+        for file in files:
+            yield from walk(file)
+
+    def find_card(self, files, card_name, card_id, logger=None):
+        """
+        Find the include file holding a card (nested includes are followed).
+
+        Parameters
+        ----------
+        files : list of str
+            Include file paths.
+        card_name : str
+            Card name or type (i.e. 'GRID' or 'elem').
+        card_id : int
+            Card id.
+        logger : Logger Object
+
+        Returns
+        -------
+        tuple or None
+            (include, offset) of the first card found (None if it is not found).
+
+        Examples
+        --------
+        >>> id_index.find_card(files, 'GRID', 4703436)
+        """
+
+        for include_ids in self.walk(files, logger):
+            offset = include_ids.find_card(card_name, card_id)
+
+            if not offset is None:
+                return include_ids.file, offset
+
+    def card_ids(self, files, keys=None, follow_includes=False, logger=None):
+        """
+        Get the ids of the cards in several include files.
+
+        Parameters
+        ----------
+        files : list of str
+            Include file paths.
+        keys : list of str, optional
+            Card names and/or types (i.e. ['GRID', 'elem']) of the cards (the
+            default is None, which implies all the cards with an integer id).
+        follow_includes : bool, optional
+            Whether or not to get the ids of the cards in nested includes too.
+        logger : Logger Object
+
+        Returns
+        -------
+        dict
+            {include (str): card ids (numpy.ndarray of int), ...}
+
+        Examples
+        --------
+        >>> id_index.card_ids(['elems.bdf'], ['elem'])
+        """
+
+        if follow_includes:
+            includes_ids = self.walk(files, logger)
+        else:
+            includes_ids = (self.get(file) for file in files)
+
+        return {include_ids.file: include_ids.card_ids(keys) for include_ids in includes_ids}
+
+    def clear(self, files=None):
+        """
+        Remove the sidecar files.
+
+        Parameters
+        ----------
+        files : list of str, optional
+            Include files whose sidecar files are removed (the default is None, which
+            implies all the sidecar files in `path`).
+        """
+
+        if files is None:
+
+            if self.path and os.path.isdir(self.path):
+                files = [os.path.join(self.path, file) for file in os.listdir(self.path) if
+                         file.endswith('.ids')]
+            else:
+                files = list()
+
+        else:
+            files = [self._sidecar_file(file) for file in files]
+
+        for file in files:
+
+            if os.path.isfile(file):
+                os.remove(file)
+
+
+def scan_ids(file, encoding=None):
+    """
+    Scan the card ids of an include file (nested includes are not followed).
+
+    The first 16 bytes of the first line of each card are processed column-wise
+    with NumPy (only the lines in free-field or large-field format, or with
+    comments, are decoded one by one).
+
+    Parameters
+    ----------
+    file : str
+        Include file path.
+    encoding : str, optional
+        File encoding (the default is None, which implies the same encoding used by
+        `open` in text mode).
+
+    Returns
+    -------
+    IncludeIds
+    """
+
+    if not encoding:
+        encoding = locale.getpreferredencoding(False)
+
+    includes = list()
+    str_ids = dict()
+
+    with open_bdf(file, 'rb') as f:
+
+        try:
+
+            if is_compressed(file):
+                contents = nullcontext(f.read())
+            else:
+                contents = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        except ValueError: # Empty file
+            contents = nullcontext(b'')
+
+        with contents as mm:
+            size = len(mm)
+            data = np.frombuffer(mm, np.uint8)
+            line_starts = np.concatenate(([0], np.flatnonzero(data == ord('\n')) + 1))
+            line_starts = line_starts[line_starts < size]
+            first_chars = data[line_starts] | 0x20 # Lower case
+            card_lines = np.flatnonzero((first_chars >= ord('a')) & (first_chars <= ord('z')))
+            offsets = line_starts[card_lines]
+
+            # Name and id fields of each card (blank after the end of the line)
+            positions = offsets[:, np.newaxis] + np.arange(16)
+            heads = data[np.minimum(positions, size - 1)]
+            del data
+            line_ends = (heads == ord('\n')) | (heads == ord('\r')) | (positions >= size)
+            heads[np.maximum.accumulate(line_ends, axis=1)] = ord(' ')
+            fields = np.char.strip(heads.view('S8'))
+            names = np.char.upper(fields[:, 0])
+            card_ids = fields[:, 1]
+            is_digit = np.char.isdigit(card_ids)
+            ids = np.full(len(offsets), -1, np.int64)
+            ids[is_digit] = card_ids[is_digit].astype(np.int64)
+
+            # Cards whose name or id can't be taken from fixed columns
+            is_other = (np.isin(heads, np.frombuffer(b',*$\t', np.uint8)).any(axis=1) |
+                        (heads >= 128).any(axis=1) | ~is_digit & (card_ids != b''))
+            names = names.astype(str).astype(object)
+
+            for index in np.flatnonzero(is_other).tolist():
+                start = offsets[index]
+                end = mm.find(b'\n', start)
+                card_name, card_id = get_card_name_id(mm[start:size if end == -1 else end].decode(encoding))
+                names[index] = card_name
+
+                if isinstance(card_id, int):
+                    ids[index] = card_id
+                else:
+                    ids[index] = -1
+                    str_ids[index] = card_id or None # Blank ids as `card.id`
+
+            names = names.astype(str)
+
+            for index in np.flatnonzero(~is_other & (card_ids == b'')).tolist():
+                str_ids[index] = None
+
+            for index in np.flatnonzero(names == 'INCLUDE').tolist():
+                # INCLUDE file names may be continued in the following lines
+                end = offsets[index + 1] if index + 1 < len(offsets) else size
+                contents = mm[offsets[index]:end]
+
+                for fields, _, _, _ in fields_in_lines(mmap_lines(contents, encoding=encoding)):
+                    includes.append(fields[1])
+
+    line_counts = np.diff(np.append(card_lines, len(line_starts))).astype(np.int32)
+    return IncludeIds(file, names, ids, offsets.astype(np.int64), line_counts, includes, str_ids)
+
+
+def scan_records(file, encoding=None):
+    """
+    Scan the card records of an include file (nested includes are not followed).
+
+    Each card record spans the comment and blank lines just before the card and
+    the card lines (as in `card_records`), so the records cover the whole file.
+
+    Parameters
+    ----------
+    file : str
+        Include file path.
+    encoding : str, optional
+        File encoding (see `scan_ids`).
+
+    Returns
+    -------
+    tuple
+        (contents, include_ids, starts, ends). `contents` are the bytes of the file,
+        `include_ids` its card ids (see `scan_ids`) and `starts` and `ends` the byte
+        span of each card record (numpy.ndarray of int, in the order of
+        `include_ids`).
+    """
+
+    with open_bdf(file, 'rb') as f:
+        contents = f.read()
+
+    include_ids = scan_ids(file, encoding)
+    data = np.frombuffer(contents, np.uint8)
+    size = len(data)
+    line_starts = np.concatenate(([0], np.flatnonzero(data == ord('\n')) + 1))
+    line_starts = line_starts[line_starts < size]
+
+    # First character of each line (leading blanks skipped)
+    positions = line_starts.copy()
+    is_blank = np.ones(len(positions), bool)
+
+    while is_blank.any():
+        blanks = np.flatnonzero(is_blank)
+        is_blank[blanks] = np.isin(data[positions[blanks]], np.frombuffer(b' \t', np.uint8))
+        blanks = np.flatnonzero(is_blank)
+        positions[blanks] += 1
+        is_blank[blanks[positions[blanks] >= size]] = False
+
+    first_chars = data[np.minimum(positions, size - 1)] if size else data
+    is_content = ~np.isin(first_chars, np.frombuffer(b'$\r\n', np.uint8)) & (positions < size)
+    del data
+
+    # Records start just after the previous card or continuation line
+    content_lines = np.flatnonzero(is_content)
+    card_lines = np.searchsorted(line_starts, include_ids.offsets)
+    previous_lines = np.searchsorted(content_lines, card_lines) - 1
+    start_lines = np.where(previous_lines >= 0, content_lines[np.maximum(previous_lines, 0)] + 1, 0)
+    start_lines[:1] = 0
+    starts = np.append(line_starts, size)[start_lines]
+    ends = np.append(starts[1:], size)
+    return contents, include_ids, starts, ends
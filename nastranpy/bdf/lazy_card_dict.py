@@ -0,0 +1,96 @@
+from collections.abc import KeysView
+
+
+class LazyCardDict(dict):
+
+    def __init__(self, loader, *args, **kwargs):
+        """
+        Initialize a LazyCardDict instance (a dict of cards by id, some of which
+        may not be built yet).
+
+        Cards not built yet are kept in `index` (id: (include, offset, size) or
+        (include, BulkCards, index)) and built by `loader` as soon as they are
+        accessed.
+
+        Parameters
+        ----------
+        loader : callable
+            Function building the cards: loader(lazy_card_dict, card_ids). It must
+            pop the ids from the index and store the new cards in the dict.
+        """
+        super().__init__(*args, **kwargs)
+        self.index = dict()
+        self._loader = loader
+
+    def __missing__(self, key):
+
+        if key in self.index:
+            self._loader(self, [key])
+            return dict.__getitem__(self, key)
+
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        self.index.pop(key, None)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+
+        if key in self.index:
+            del self.index[key]
+        else:
+            dict.__delitem__(self, key)
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or key in self.index
+
+    def __len__(self):
+        return dict.__len__(self) + len(self.index)
+
+    def __iter__(self):
+        yield from dict.__iter__(self)
+        yield from self.index
+
+    def get(self, key, default=None):
+
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def pop(self, key, *args):
+
+        if key in self.index:
+            self._loader(self, [key])
+
+        return dict.pop(self, key, *args)
+
+    def keys(self):
+        return KeysView(self)
+
+    def values(self):
+        self.materialize()
+        return dict.values(self)
+
+    def items(self):
+        self.materialize()
+        return dict.items(self)
+
+    def materialize(self, card_ids=None):
+        """
+        Build the cards not built yet.
+
+        Parameters
+        ----------
+        card_ids : list of int, optional
+            Ids of the cards to build (the default is None, which implies all the
+            cards will be built).
+        """
+
+        if card_ids is None:
+            card_ids = list(self.index)
+        else:
+            card_ids = [card_id for card_id in card_ids if card_id in self.index]
+
+        if card_ids:
+            self._loader(self, card_ids)
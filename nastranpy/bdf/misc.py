@@ -1,5 +1,7 @@
 import os
 import time
+import gzip
+import lzma
 from functools import wraps
 
 
@@ -23,6 +25,53 @@ def assure_path_exists(path):
         os.makedirs(dir)
 
 
+def file_stamp(file):
+    stat = os.stat(file)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def is_compressed(file):
+    return os.path.splitext(file)[1].lower() in ('.gz', '.xz', '.zst')
+
+
+def open_bdf(file, mode='r', newline=None):
+    """
+    Open a file, decompressing (or compressing) it on the fly if its name ends with
+    '.gz', '.xz' or '.zst' (the last one needs the zstandard package).
+
+    Parameters
+    ----------
+    file : str
+        File path.
+    mode : {'r', 'rb', 'w', 'wb'}, optional
+        Opening mode. Text mode uses the same encoding and universal newlines as
+        `open`.
+    newline : str, optional
+        Newline mode of text mode (see `open`). Use '' to write the line endings
+        as supplied.
+
+    Returns
+    -------
+    file object
+    """
+    extension = os.path.splitext(file)[1].lower()
+
+    if extension == '.gz':
+        return gzip.open(file, mode if 'b' in mode else mode + 't', newline=newline)
+    elif extension == '.xz':
+        return lzma.open(file, mode if 'b' in mode else mode + 't', newline=newline)
+    elif extension == '.zst':
+
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("The zstandard package is needed to open '{}'".format(file))
+
+        return zstandard.open(file, mode if 'b' in mode else mode + 't', newline=newline)
+    else:
+        return open(file, mode, newline=newline)
+
+
 def get_singular(name):
 
     if name[-3:] == 'ies':
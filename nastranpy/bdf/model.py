@@ -1,12 +1,93 @@
 import os
 import csv
 import logging
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from nastranpy.bdf.cards.card_interfaces import item_types, set_types, sorted_cards
 from nastranpy.bdf.cards.card_factory import card_factory
-from nastranpy.bdf.read_bdf import cards_in_file
+from nastranpy.bdf.cards.card import Card
+from nastranpy.bdf.cards.include_card import card_key, record_keys
+from nastranpy.bdf.read_bdf import fields_in_files, fields_in_lines, mmap_lines, index_files
+from nastranpy.bdf.read_bulk import bulk_fields_in_files, BulkCards
 from nastranpy.bdf.case_set import CaseSet
-from nastranpy.bdf.misc import timeit, get_plural, indent, get_id_info, humansize, CallCounted
+from nastranpy.bdf.cache import IncludeCache
+from nastranpy.bdf.id_index import scan_ids, scan_records
+from nastranpy.bdf.lazy_card_dict import LazyCardDict
+from nastranpy.bdf.grid_store import GridStore
+from nastranpy.bdf.connectivity import ConnectivityTable, table_width
+from nastranpy.bdf.misc import timeit, get_plural, indent, get_id_info, humansize, CallCounted, file_stamp, open_bdf
 from nastranpy.bdf.id_pattern import IdPattern
+from nastranpy.bdf.write_bdf import print_cards, write_chunks
+
+
+lazy_types = ('elem', 'grid', 'mat', 'prop')
+
+
+def serialize_include(include, source_file=None):
+    """
+    Get the cards of an include file in the form passed to `write_include`.
+
+    Parameters
+    ----------
+    include : IncludeCard
+        Include file.
+    source_file : str, optional
+        File of the include as readed (see `write_include`).
+
+    Returns
+    -------
+    tuple
+        (cards, commented_cards, source_file). Cards are tuples of (fields,
+        large_field, free_field, comment, is_commented, is_edited). Only the name
+        and the id of the cards to be copied from `source_file` are supplied.
+    """
+    copied_keys = set()
+
+    if source_file:
+        copied_keys = {key for key, count in Counter(record_keys(scan_ids(source_file))).items() if count == 1}
+
+    cards = list()
+
+    for card in include.cards:
+        key = card_key(card)
+
+        if key in copied_keys and not card._is_edited and not card.is_commented:
+            cards.append((list(key), card.large_field, card.free_field, '', False, False))
+        else:
+            cards.append((card.get_fields(), card.large_field, card.free_field, card.comment,
+                          card.is_commented, card._is_edited))
+
+    commented_cards = [(card.get_fields(), card.large_field, card.free_field, card.comment, True, True) for
+                       card in include.commentted_cards]
+    return cards, commented_cards, source_file
+
+
+def write_include(file, cards, commented_cards, source_file=None):
+    """
+    Write an include file from the fields of its cards (i.e. in a worker process).
+
+    Parameters
+    ----------
+    file : str
+        Include file path.
+    cards, commented_cards : list of tuple
+        Cards of the include file (as given by `serialize_include`).
+    source_file : str, optional
+        File of the include as readed, to copy the cards not edited from it (the
+        default is None, which implies all cards are printed).
+    """
+    include = card_factory.get_card(['INCLUDE', file])
+
+    def get_card(fields, large_field, free_field, comment, is_commented, is_edited):
+        card = card_factory.get_card(fields, large_field=large_field, free_field=free_field)
+        card.comment = comment
+        card.is_commented = is_commented
+        card._is_edited = is_edited
+        return card
+
+    include.cards = {get_card(*card) for card in cards}
+    include.commentted_cards = {get_card(*card) for card in commented_cards}
+    include.write(scan_records(source_file) if source_file else None)
 
 
 class Model(object):
@@ -39,8 +120,11 @@ class Model(object):
         self.sets = {set_type: dict() for set_type in set_types}
         self.all_items = {**self.items, **self.sets}
         self.unsupported_cards = set()
+        self.grid_store = GridStore() # Grid ids and coordinates by columns
+        self._connectivity = dict() # {element card name: ConnectivityTable}
         self.warnings = 0
         self.errors = 0
+        self._new_cards = None # Cards built in a lazy read pending to be processed
 
         for item_type in self.items:
             setattr(self, get_plural(item_type), self.items[item_type])
@@ -49,7 +133,8 @@ class Model(object):
             setattr(self, get_plural(set_type), self.sets[set_type])
 
     # @timeit
-    def read(self, files, card_names=None):
+    def read(self, files, card_names=None, engine='text', workers=None, cache=False, lazy=False, bulk=False,
+             shard_size=2 ** 26):
         """
         Read include files.
 
@@ -60,6 +145,38 @@ class Model(object):
         card_names : list of str, optional
             List of card names to read (the default is None, which implies that all
             cards will be imported).
+        engine : {'text', 'mmap'}, optional
+            Reading engine (see `cards_in_file`). Use 'mmap' for huge files.
+        workers : int, optional
+            Number of worker processes used to parse the include files (the default
+            is None, which implies the files are parsed one after another). Include
+            files bigger than `shard_size` are split and parsed in several workers
+            too (see `read_bdf.file_shards`). Cards are built, linked and arranged in
+            this process in the same order anyway.
+        cache : bool, str or IncludeCache, optional
+            Whether or not to use an on-disk cache of the parsed include files, so
+            only the files changed since the last time they were readed are parsed.
+            If a str is supplied, it will be used as the cache directory (the
+            default directory is '.nastranpy_cache' in the model path). An
+            `IncludeCache` instance is used as is (i.e. to check the content hash
+            of the files too).
+        lazy : bool, optional
+            Whether or not to build grid, element, material and property cards only
+            when they are accessed (through `model.grids[id]`, `model.cards(...)`,
+            etc.). Meanwhile only the location of each card in the files is kept.
+            `engine`, `workers`, `cache` and `shard_size` are not used in this mode.
+            Note that referring cards (`child_cards`, `grid.elems`, `include.cards`,
+            ...) are only known once built (see `materialize`).
+        bulk : bool, optional
+            Whether or not to read GRID, CQUAD4, CTRIA3, CBAR and CHEXA cards into
+            NumPy arrays (see `read_bulk.parse_bulk`) and build them only when they
+            are accessed (as in lazy mode). The rest of the cards are readed as
+            usual. `engine`, `workers`, `cache`, `lazy` and `shard_size` are not used
+            in this mode.
+        shard_size : int, optional
+            Size (in bytes) of the ranges huge include files are split into when
+            parsed in several workers (the default is 64 MB). Use None not to split
+            the files.
 
         Example:
         --------
@@ -68,6 +185,21 @@ class Model(object):
 
         Import only coordinate system cards (much faster):
         >>> model.read(files, ['CORD2R', 'CORD2C', 'CORD2S', 'CORD1R', 'CORD1C', 'CORD1S'])
+
+        Parse the include files in 8 worker processes:
+        >>> model.read(files, workers=8)
+
+        Parse only the include files changed since the last session:
+        >>> model.read(files, cache=True)
+
+        Check the content hash of the cached include files too:
+        >>> model.read(files, cache=IncludeCache('.nastranpy_cache', check_hash=True))
+
+        Build only the cards used afterwards (much faster for huge models):
+        >>> model.read(files, lazy=True)
+
+        Read grid and element cards in bulk:
+        >>> model.read(files, bulk=True)
         """
         self._log.warning.counter = 0
         self._log.error.counter = 0
@@ -79,20 +211,53 @@ class Model(object):
             files = [file.replace(self.path, '')[1:] for file in files]
 
         os.chdir(self.path)
+
+        if isinstance(cache, str):
+            cache = IncludeCache(cache)
+        elif cache is True:
+            cache = IncludeCache(os.path.join(self.path, '.nastranpy_cache'))
+        elif not cache:
+            cache = None
+        elif not isinstance(cache, IncludeCache):
+            raise TypeError('cache must be a bool, a str or an IncludeCache instance')
+
         self._log.info('Reading files ...')
 
-        for file in files:
-            self._classify_card(card_factory.get_card(['INCLUDE', file]))
+        if lazy or bulk:
+            self._index_files(files, card_names, bulk)
+        else:
 
-            for card in cards_in_file(file, card_names=card_names, generic_cards=False,
-                                      logger=self._log):
+            for include, fields, is_large_field, is_free_field, comment in fields_in_files(files, card_names,
+                                                                                         engine=engine,
+                                                                                         workers=workers,
+                                                                                         shard_size=shard_size,
+                                                                                         cache=cache,
+                                                                                         logger=self._log):
+                card = card_factory.get_card(fields, large_field=is_large_field, free_field=is_free_field)
+                card.include = include
+                card.comment = comment
                 self._classify_card(card)
 
+        self._stamp_includes()
         self._log.info('All files readed succesfully!')
 
         self._log.info('Processing cards ...')
 
-        if self._link_cards:
+        if lazy or bulk:
+            cards = self._new_cards
+
+            # Cards built meanwhile are appended to the list (and processed too)
+            for card in cards:
+
+                if not card.type in self.items or self.items[card.type].get(card.id) is card:
+                    card._process_fields(self.all_items if self._link_cards else None)
+
+            self._new_cards = None
+
+            if self._link_cards:
+                self._arrange_grids(cards)
+
+        elif self._link_cards:
 
             for card in self._cards():
                 card._process_fields(self.all_items)
@@ -117,29 +282,415 @@ class Model(object):
         else:
             self._log.info('Cards processed succesfully!')
 
-    def write(self, includes=None):
+    def reload(self, card_names=None, engine='text'):
+        """
+        Re-read the include files modified since they were readed.
+
+        Only the cards of the modified files are deleted and readed again. The cards
+        referring to them (and the grids and coordinate systems depending on those)
+        are linked and arranged again, the rest of the model is left untouched.
+
+        Parameters
+        ----------
+        card_names : list of str, optional
+            List of card names to read from the modified files (the default is None,
+            which implies that all cards will be imported).
+        engine : {'text', 'mmap'}, optional
+            Reading engine (see `cards_in_file`).
+
+        Returns
+        -------
+        list of IncludeCard
+            Reloaded includes.
+
+        Example:
+        --------
+        >>> model.reload()
+        """
+        os.chdir(self.path)
+        includes = list()
+
+        for include in self.includes.values():
+
+            try:
+
+                if include._stamp and file_stamp(include.file) != include._stamp:
+                    includes.append(include)
+
+            except FileNotFoundError:
+                self._log.warning("No such file: '{}'".format(include.file))
+
+        if not includes:
+            self._log.info('No modified files')
+            return includes
+
+        self._log.warning.counter = 0
+        self._log.error.counter = 0
+        self._log.info('Reloading files ...\n{}'.format(indent('\n'.join(include.file for include in includes))))
+        cards2delete = {card for include in includes for card in include.cards if card.type != 'include'}
+        files = {include.file for include in includes}
+
+        for card_type in lazy_types:
+            cards = self.items[card_type]
+
+            if isinstance(cards, LazyCardDict):
+
+                for card_id in [card_id for card_id, (include, _, _) in cards.index.items() if include in files]:
+                    del cards.index[card_id]
+
+        # Cards (in other files) referring to the cards to be deleted
+        affected_cards = set()
+
+        for card in cards2delete:
+            parent_cards = [card]
+
+            if card.type in self.sets:
+                parent_cards.append(card.set)
+
+            for parent_card in parent_cards:
+                affected_cards.update(child_card for child_card in parent_card.observers if
+                                      isinstance(child_card, Card) and not child_card in cards2delete)
+
+        # Grids and coordinate systems depending on them must be arranged again
+        cards2check = [card for card in affected_cards if card.type in ('grid', 'coord')]
+
+        while cards2check:
+            card = cards2check.pop()
+
+            for child_card in card.child_cards():
+
+                if child_card.type in ('grid', 'coord') and not child_card in affected_cards:
+                    affected_cards.add(child_card)
+                    cards2check.append(child_card)
+
+        # Fields are stored as IDs (and local coordinates) before unlinking anything
+        for card in affected_cards:
+            card._unprocess_fields()
+
+        for card in cards2delete:
+            self._delete_card(card)
+
+        for include, fields, is_large_field, is_free_field, comment in fields_in_files([include.file for include in includes],
+                                                                                     card_names,
+                                                                                     engine=engine,
+                                                                                     skipped_files=set(self.includes),
+                                                                                     logger=self._log):
+
+            if include is None or fields[0] == 'INCLUDE' and fields[1] in self.includes:
+                continue
+
+            card = card_factory.get_card(fields, large_field=is_large_field, free_field=is_free_field)
+            card.include = include
+            card.comment = comment
+            self._classify_card(card)
+
+        includes += [include for include in self.includes.values() if include._stamp is None]
+        self._stamp_includes(includes)
+        new_cards = {card for include in includes for card in include.cards if card.type != 'include'}
+        self._log.info('All files readed succesfully!')
+
+        self._log.info('Processing cards ...')
+        cards = new_cards | affected_cards
+
+        for card in cards:
+            card._process_fields(self.all_items if self._link_cards else None)
+
+        if self._link_cards:
+
+            for card in affected_cards:
+
+                try:
+                    card._unsettle()
+                except AttributeError:
+                    pass
+
+            self._arrange_grids(cards)
+
+            for card in cards:
+
+                if card.type == 'grid':
+
+                    for elem in card.elems:
+                        elem._unsettle()
+
+        self.warnings += self._log.warning.counter
+        self.errors += self._log.error.counter
+
+        if self._log.error.counter:
+            self._log.info("Cards processed with errors! (see 'model.log' for more details)")
+        elif self._log.warning.counter:
+            self._log.info("Cards processed with warnings! (see 'model.log' for more details)")
+        else:
+            self._log.info('Cards processed succesfully!')
+
+        return includes
+
+    def _index_files(self, files, card_names=None, bulk=False):
+
+        for card_type in lazy_types:
+
+            if not isinstance(self.items[card_type], LazyCardDict):
+                self.items[card_type] = LazyCardDict(self._load_cards, self.items[card_type])
+                self.all_items[card_type] = self.items[card_type]
+                setattr(self, get_plural(card_type), self.items[card_type])
+
+        self._new_cards = list()
+
+        if bulk:
+            records = bulk_fields_in_files(files, card_names, logger=self._log)
+        else:
+            indexed_names = {card_name for card_name, card_type in card_factory.names2types.items() if
+                             card_type in lazy_types}
+            records = index_files(files, card_names, indexed_names, logger=self._log)
+
+        for include, fields, is_large_field, is_free_field, comment, location in records:
+
+            if location:
+                cards = self.items[card_factory.names2types[fields[0]]]
+
+                if fields[1] in cards: # Both cards are built to warn about it
+                    cards[fields[1]]
+                    cards.index[fields[1]] = (include, *location)
+                    self._load_cards(cards, [fields[1]])
+                else:
+                    cards.index[fields[1]] = (include, *location)
+
+            else:
+                card = card_factory.get_card(fields, large_field=is_large_field, free_field=is_free_field)
+                card.include = include
+                card.comment = comment
+                self._classify_card(card)
+                self._new_cards.append(card)
+
+    def _load_cards(self, cards, card_ids):
+        records = dict()
+        new_cards = list()
+
+        for card_id in card_ids:
+            include, *location = cards.index.pop(card_id)
+
+            if isinstance(location[0], BulkCards):
+                card = location[0].get_card(location[1])
+                card.include = include
+                self._classify_card(card)
+                new_cards.append(card)
+            else:
+                records.setdefault(include, list()).append(location)
+
+        for include, include_records in records.items():
+
+            with open_bdf(os.path.join(self.path, include), 'rb') as f:
+
+                for offset, size in sorted(include_records):
+                    f.seek(offset)
+
+                    for fields, is_large_field, is_free_field, comment in fields_in_lines(mmap_lines(f.read(size))):
+                        card = card_factory.get_card(fields, large_field=is_large_field, free_field=is_free_field)
+                        card.include = include
+                        card.comment = comment
+                        self._classify_card(card)
+                        new_cards.append(card)
+
+        if self._new_cards is None:
+
+            for card in new_cards:
+                card._process_fields(self.all_items if self._link_cards else None)
+
+            if self._link_cards:
+                self._arrange_grids(new_cards)
+
+        else:
+            self._new_cards += new_cards
+
+    def materialize(self, includes=None):
+        """
+        Build the cards not built yet in a lazy read (see `read`).
+
+        Parameters
+        ----------
+        includes : list of str, optional
+            List of include filenames (the default is None, which implies all model
+            cards will be built).
+        """
+
+        for card_type in lazy_types:
+            cards = self.items[card_type]
+
+            if isinstance(cards, LazyCardDict) and cards.index:
+
+                if includes is None:
+                    cards.materialize()
+                else:
+                    cards.materialize([card_id for card_id, (include, _, _) in cards.index.items() if
+                                       include in includes])
+
+    def _stamp_includes(self, includes=None):
+
+        if includes is None:
+            includes = [include for include in self.includes.values() if include._stamp is None]
+
+        for include in includes:
+
+            try:
+                include._stamp = file_stamp(include.file)
+            except FileNotFoundError:
+                pass
+
+            include.is_modified = False
+
+    def write(self, includes=None, compression=None, reformat=False, workers=None):
         """
         Write include files.
 
+        Include files whose name ends with '.gz', '.xz' or '.zst' are written
+        compressed.
+
+        Only the include files modified since they were readed (or written) are
+        written by default: those with cards created, deleted, moved in or out,
+        renumbered or edited through their attributes (i.e. `grid.xyz`,
+        `elem.prop`). Within them, the cards not edited are copied verbatim from
+        the file as readed (if it has not changed since then), keeping their
+        order, formatting and comments. Direct changes to `card.fields` or to the
+        printing options (`large_field`, `free_field`, `comment`, ...) are not
+        tracked: supply the include files explicitly and set `reformat`.
+
         Parameters
         ----------
         includes : list of str, optional
-            List of include filenames(the default is None, which implies all
-            model includes will be written).
+            List of include filenames (the default is None, which implies all
+            modified model includes will be written, or all of them if
+            `compression` is supplied).
+        compression : {'gz', 'xz', 'zst'}, optional
+            Compress the include files, appending the extension to their names (the
+            INCLUDE cards referring to them are renamed accordingly). 'zst' needs the
+            zstandard package.
+        reformat : bool, optional
+            Whether or not to print all the cards (sorted by type and id) instead of
+            copying the ones not edited.
+        workers : int, optional
+            Number of worker processes used to write the include files (the default
+            is None, which implies the files are written one after another in this
+            process). Each worker gets the fields of the cards to print and the names
+            and ids of the cards to copy.
+
+        Examples
+        --------
+        >>> model.grids[1001].xyz = [0.0, 5.0, 0.0]
+        >>> model.write() # Only the include file of grid 1001 is written
+
+        >>> model.write(compression='gz')
+
+        Write all the include files in 8 worker processes:
+        >>> model.write(model.includes, reformat=True, workers=8)
         """
 
         if not includes:
-            includes = self.includes
+
+            if compression:
+                includes = self.includes
+            else:
+                includes = [include_name for include_name, include in self.includes.items() if
+                            include.is_modified]
 
         includes = [self.includes[include_name] for include_name in includes]
+
+        if compression:
+            renamed_includes = [include for include in includes if not include.file.endswith('.' + compression)]
+
+            # Includes referring to the renamed ones are written too
+            includes += [include for include in dict.fromkeys(include.include for include in renamed_includes) if
+                         include and not include in includes]
+
+        self.materialize([include.file for include in includes])
         os.chdir(self.path)
-        self._log.info('Writting files ...')
+        source_files = {include: os.path.join(self.path, include.file) for include in includes}
+
+        if compression:
+            # All the includes are renamed first, so INCLUDE cards are written with the new names
+            for include in renamed_includes:
+                include.file = include.file + '.' + compression
 
         for include in includes:
-            include.write()
 
+            if reformat or not include._stamp:
+                source_files[include] = None
+            else:
+
+                try:
+
+                    if file_stamp(source_files[include]) != include._stamp: # Changed since readed
+                        source_files[include] = None
+
+                except FileNotFoundError:
+                    source_files[include] = None
+
+        self._log.info('Writting files ...')
+
+        if workers:
+
+            with ProcessPoolExecutor(workers) as executor:
+                futures = [executor.submit(write_include, os.path.join(self.path, include.file),
+                                           *serialize_include(include, source_files[include])) for
+                           include in includes]
+
+                for future in futures:
+                    future.result()
+
+            for include in includes:
+
+                for card in include.cards:
+                    card._is_edited = False
+
+        else:
+
+            for include in includes:
+                include.write(scan_records(source_files[include]) if source_files[include] else None)
+
+        self._stamp_includes(includes)
         self._log.info('All files written succesfully!')
 
+    def export(self, file, flatten_includes=True):
+        """
+        Write the model to a single file.
+
+        Cards are printed in chunks (the text of the cards already printed is
+        reused) and streamed to the file, so the output is never held in memory.
+
+        Parameters
+        ----------
+        file : str or file object
+            Output filename (written compressed if it ends with '.gz', '.xz' or
+            '.zst') or file object opened in text mode.
+        flatten_includes : bool, optional
+            Whether or not to write the cards of all the include files sorted by
+            type and id, leaving out the INCLUDE cards. Otherwise only the cards of
+            the main files (those not included by others) are written, INCLUDE
+            cards included, so the output refers to the existing include files (as
+            they are named relative to the model path).
+
+        Examples
+        --------
+        >>> model.export('flat.bdf.gz')
+        """
+        self.materialize()
+
+        if flatten_includes:
+            cards = (card for card in self._cards() if card.type != 'include')
+        else:
+            cards = (card for include in self.includes.values() if not include.include for
+                     card in include.cards)
+
+        # Texts of the cards printed only for the export are not cached
+        cards = (card + '\n' for card in print_cards(sorted_cards(cards), print_comment=True, cache=False))
+
+        if isinstance(file, str):
+
+            with open_bdf(file, 'w') as f:
+                write_chunks(f, cards)
+
+        else:
+            write_chunks(file, cards)
+
     def _classify_card(self, card):
 
         if card.include:
@@ -155,7 +706,19 @@ class Model(object):
                                                     previous_card.include, indent(previous_card.head(), 8),
                                                     card.include, indent(card.head(), 8)))))
 
+                # The old card is dropped from the columnar tables too
+                if card.type == 'grid' and previous_card._store is self.grid_store:
+                    self.grid_store.remove(previous_card)
+                elif card.type == 'elem' and not previous_card._table is None:
+                    previous_card._table.remove(previous_card)
+
             self.items[card.type][card.id] = card
+
+            if card.type == 'grid':
+                self.grid_store.add(card)
+            elif card.type == 'elem' and card.name in self._connectivity:
+                self._connectivity[card.name].add(card)
+
         elif card.type in self.sets:
 
             if not card.id in self.sets[card.type]:
@@ -168,26 +731,65 @@ class Model(object):
 
         card._split()
 
-    def _arrange_grids(self):
-        resolved_cards = set()
-        unresolved_cards = set(self._cards(['grid', 'coord']))
+    def _arrange_grids(self, cards=None):
+
+        if cards is None:
+            cards = list(self._cards(['grid', 'coord']))
+        else:
+            cards = [card for card in set(cards) if card.type in ('grid', 'coord')]
+
+        # Dependency graph (CP of grids, RID or G1A/G2A/G3A of coordinate systems)
+        unresolved_cards = set(cards)
+        n_parents = dict() # {card: parents not settled yet}
+        children = dict() # {card: cards depending on it}
+
+        for card in cards:
+            n_parents[card] = 0
+
+            for parent_card in card._settle_parents():
 
-        while unresolved_cards:
-            cards2resolve = set()
+                if parent_card in unresolved_cards:
+                    n_parents[card] += 1
+                    children.setdefault(parent_card, list()).append(card)
 
-            for card in unresolved_cards:
+        # Topological order (Kahn's algorithm), settled level by level
+        cards2resolve = [card for card in cards if not n_parents[card]]
 
-                if all((parent_card in resolved_cards for parent_card in card.parent_cards())):
-                    cards2resolve.add(card)
+        while cards2resolve:
+            # Grids are settled by coordinate system (see `GridStore.settle`)
+            self.grid_store.settle(card for card in cards2resolve if card.type == 'grid')
+            next_cards = list()
 
             for card in cards2resolve:
-                card._settle()
 
-            if not cards2resolve:
-                break
+                if card.type != 'grid':
+                    card._settle()
 
-            unresolved_cards -= cards2resolve
-            resolved_cards |= cards2resolve
+                unresolved_cards.discard(card)
+
+                for child_card in children.get(card, ()):
+                    n_parents[child_card] -= 1
+
+                    if not n_parents[child_card]:
+                        next_cards.append(child_card)
+
+            cards2resolve = next_cards
+
+        if unresolved_cards:
+            # Cards left depend on a cycle or are part of it (those trimmed last)
+            cycle_cards = set(unresolved_cards)
+
+            while True:
+                cards2trim = {card for card in cycle_cards if
+                              not any(child_card in cycle_cards for child_card in children.get(card, ()))}
+
+                if not cards2trim:
+                    break
+
+                cycle_cards -= cards2trim
+
+            self._log.error('Cannot settle {} cards, circular definition: {}'.format(
+                len(unresolved_cards), ', '.join(sorted(repr(card) for card in cycle_cards))))
 
     def _update(self, caller, **kwargs):
 
@@ -216,6 +818,9 @@ class Model(object):
 
                 mapping[value.id] = value
 
+                if not self._new_cards is None:
+                    self._new_cards.append(value)
+
     @staticmethod
     def _update_mapping(mapping, caller, old_key, new_key, error_message=''):
 
@@ -312,7 +917,7 @@ class Model(object):
                 by_ids = True
 
         if includes:
-
+            self.materialize(includes)
             yield from (card for include in includes for card in self.includes[include].cards if
                         (not card_types or card.type in card_types) and
                         (not card_tags or card.tag in card_tags) and
@@ -363,6 +968,52 @@ class Model(object):
         if not card_types and not card_ids:
             yield from self.unsupported_cards
 
+    def connectivity(self, card_name):
+        """
+        Get the connectivity table of the elements of a card name (the rows of their
+        grids in `grid_store`).
+
+        The table is built the first time it is requested (all the elements are
+        built in a lazy read) and kept in sync with the model afterwards.
+
+        Parameters
+        ----------
+        card_name : str
+            Element card name.
+
+        Returns
+        -------
+        ConnectivityTable
+
+        Examples
+        --------
+        >>> table = model.connectivity('CQUAD4')
+        >>> xyz0 = model.grid_store.xyz0[table.grid_rows] # n x 4 x 3
+        """
+
+        try:
+            return self._connectivity[card_name]
+        except KeyError:
+            pass
+
+        try:
+            card_class = card_factory.card_classes[card_name]
+        except KeyError:
+            card_class = None
+
+        if card_class is None or card_class.type != 'elem':
+            raise ValueError('{} is not an element card!'.format(card_name))
+
+        table = ConnectivityTable(card_name, self.grid_store, table_width(card_class._scheme))
+
+        for elem in self.elems.values():
+
+            if elem.name == card_name:
+                table.add(elem)
+
+        self._connectivity[card_name] = table
+        return table
+
     @property
     def log_path(self):
         return [log_handler for log_handler in self._log.handlers if
@@ -507,6 +1158,8 @@ class Model(object):
             will be 'model_summary.csv').
         """
 
+        self.materialize()
+
         if not file:
             os.chdir(self.path)
             file = 'model_summary.csv'
@@ -595,6 +1248,8 @@ class Model(object):
             Card to be deleted.
         """
 
+        self.materialize()
+
         if list(card.child_cards()):
             raise ValueError('{} is referred by other card/s!'.format(repr(card)))
         else:
@@ -602,11 +1257,29 @@ class Model(object):
 
     def _delete_card(self, card):
 
-        for parent_card in card.parent_cards():
+        for parent_card in set(card.parent_cards()):
             parent_card._unsubscribe(card)
 
+        if card.type == 'elem':
+
+            for grid in card.parent_cards('grid'):
+
+                try:
+                    grid._remove_elem(card)
+                except KeyError:
+                    pass
+
+            if not card._table is None:
+                card._table.remove(card)
+
+        elif card.type == 'grid' and card._store is self.grid_store:
+            self.grid_store.remove(card)
+
         if card.type in self.items:
-            del self.items[card.type][card.id]
+
+            if self.items[card.type].get(card.id) is card:
+                del self.items[card.type][card.id]
+
         elif card.type in self.sets:
             self.sets[card.type][card.id].cards.remove(card)
 
@@ -631,6 +1304,7 @@ class Model(object):
         set of Card
             Cards not referred by other cards.
         """
+        self.materialize()
         return {card for card in self.cards(card_type) if not card.child_cards()}
 
     def delete_unused_cards(self, card_type):
@@ -681,6 +1355,8 @@ class Model(object):
         >>> model.renumber('grids', correlation={5001:9005001, 5002:9005002, 5003:9005003, 5004:9005004})
         """
 
+        self.materialize()
+
         if card_type in self.items:
             mapping = self.items[card_type]
         elif card_type in self.sets:
@@ -1,23 +1,97 @@
+def add_item(items, value, max_size=8):
+    """
+    Add an item to a compact collection.
+
+    Small collections are stored as tuples (much lighter than sets) and grow into
+    sets once they hold more than `max_size` items.
+
+    Parameters
+    ----------
+    items : tuple or set
+        Collection.
+    value : object
+        Item to add (only if not already in the collection).
+    max_size : int, optional
+        Maximum number of items stored as a tuple.
+
+    Returns
+    -------
+    tuple or set
+        Updated collection (a new one if `items` was a tuple).
+    """
+    if type(items) is tuple:
+
+        if value in items:
+            return items
+
+        if len(items) < max_size:
+            return items + (value,)
+
+        items = set(items)
+
+    items.add(value)
+    return items
+
+
+def remove_item(items, value):
+    """
+    Remove an item from a compact collection (see `add_item`).
+
+    Parameters
+    ----------
+    items : tuple or set
+        Collection.
+    value : object
+        Item to remove.
+
+    Returns
+    -------
+    tuple or set
+        Updated collection (a new one if `items` was a tuple).
+
+    Raises
+    ------
+    KeyError
+        If the item is not in the collection (as `set.remove`).
+    """
+    if type(items) is tuple:
+
+        try:
+            index = items.index(value)
+        except ValueError:
+            raise KeyError(value)
+
+        return items[:index] + items[index + 1:]
+
+    items.remove(value)
+    return items
+
+
 class Observable(object):
+    __slots__ = ('_observers', 'changed')
 
     def __init__(self):
-        self.observers = set()
+        self._observers = ()
         self.changed = False
 
+    @property
+    def observers(self):
+        return self._observers
+
     def _subscribe(self, value):
-        self.observers.add(value)
+        self._observers = add_item(self._observers, value)
 
     def _unsubscribe(self, value):
-        self.observers.remove(value)
+        self._observers = remove_item(self._observers, value)
 
     def _unsubscribe_all(self):
-        self.observers.clear()
+        self._observers = ()
 
     def _notify(self, *args, **kwargs):
 
         if self.changed:
 
-            for observer in self.observers:
+            for observer in self._observers:
                 observer._update(self, *args, **kwargs)
 
             self.changed = False
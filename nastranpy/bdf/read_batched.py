@@ -0,0 +1,188 @@
+import numpy as np
+from nastranpy.bdf.read_bdf import fields_in_files
+from nastranpy.bdf.cards.card_factory import card_factory
+
+
+class CardBatch(object):
+
+    def __init__(self, names, ids, fields, n_fields, large_field, free_field, comments, includes):
+        """
+        Initialize a CardBatch instance (a block of consecutive cards stored by
+        columns, one row per card).
+
+        Parameters
+        ----------
+        names : numpy.ndarray of str
+            Card names.
+        ids : numpy.ndarray of int
+            Card ids (-1 for cards without an integer id).
+        fields : numpy.ndarray of object
+            Card fields (n x maximum number of fields), card name and id included.
+            Rows are padded with blank fields ('').
+        n_fields : numpy.ndarray of int
+            Number of fields of each card.
+        large_field : numpy.ndarray of bool
+            Whether or not each card is in large-field format.
+        free_field : numpy.ndarray of bool
+            Whether or not each card is in free-field format.
+        comments : numpy.ndarray of object
+            Comment (str) of each card.
+        includes : numpy.ndarray of object
+            Include file (str) of each card.
+        """
+        self.names = names
+        self.ids = ids
+        self.fields = fields
+        self.n_fields = n_fields
+        self.large_field = large_field
+        self.free_field = free_field
+        self.comments = comments
+        self.includes = includes
+
+    def __repr__(self):
+        return '<CardBatch: {} cards>'.format(len(self))
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, key):
+        """
+        Get the cards selected by an index, slice or mask as a new CardBatch.
+
+        Examples
+        --------
+        >>> grids = batch[batch.names == 'GRID']
+        """
+        return CardBatch(self.names[key], self.ids[key], self.fields[key], self.n_fields[key],
+                         self.large_field[key], self.free_field[key], self.comments[key],
+                         self.includes[key])
+
+    def get_fields(self, index):
+        """
+        Get the fields of a card (as readed by `cards_in_file`).
+
+        Parameters
+        ----------
+        index : int
+            Card index.
+
+        Returns
+        -------
+        list of int, float or str
+            Card fields.
+        """
+        return self.fields[index, :self.n_fields[index]].tolist()
+
+    def get_card(self, index):
+        """
+        Build a card (not linked to any model).
+
+        Parameters
+        ----------
+        index : int
+            Card index.
+
+        Returns
+        -------
+        Card
+            Card object.
+        """
+        card = card_factory.get_card(self.get_fields(index), large_field=bool(self.large_field[index]),
+                                     free_field=bool(self.free_field[index]))
+        card.include = str(self.includes[index])
+        card.comment = str(self.comments[index])
+        return card
+
+    def cards(self):
+        """
+        Build all the cards.
+
+        Yields
+        -------
+        Card
+            Card object.
+        """
+        yield from (self.get_card(index) for index in range(len(self)))
+
+
+def cards_in_file_batched(file, batch_size=100000, card_names=None, ignore_comments=False,
+                          engine='text', logger=None):
+    """
+    Get the cards in a file (following nested includes) in blocks of `batch_size`
+    cards stored by columns (see `CardBatch`).
+
+    No card objects are built and only one block is kept in memory at a time, so
+    huge decks can be processed (i.e. filtered or exported) block by block.
+
+    Parameters
+    ----------
+    file : str
+        Include file path.
+    batch_size : int, optional
+        Maximum number of cards in each block.
+    card_names : list of str, optional
+        Card names to read. Other cards will be ignored (the default is None, which
+        implies all cards will be readed).
+    ignore_comments : bool, optional
+        Whether or not to ignore the comments in the file.
+    engine : {'text', 'mmap'}, optional
+        Reading engine (see `cards_in_file`).
+    logger : Logger Object
+
+    Yields
+    -------
+    CardBatch
+        Block of consecutive cards (in file order).
+
+    Examples
+    --------
+    Export the grid coordinates to a CSV file:
+    >>> with open('grids.csv', 'w') as f:
+    ...     for batch in cards_in_file_batched('mesh.bdf', card_names=['GRID']):
+    ...         grids = batch[batch.names == 'GRID']
+    ...         np.savetxt(f, np.column_stack((grids.ids, grids.fields[:, 3:6])),
+    ...                    fmt=['%d', '%f', '%f', '%f'], delimiter=',')
+    """
+    records = list()
+
+    for record in fields_in_files([file], card_names, ignore_comments, engine, logger=logger):
+
+        if record[0] is None: # Pseudo INCLUDE card of the file itself
+            continue
+
+        records.append(record)
+
+        if len(records) == batch_size:
+            yield get_card_batch(records)
+            records = list()
+
+    if records:
+        yield get_card_batch(records)
+
+
+def get_card_batch(records):
+    """
+    Store cards by columns.
+
+    Parameters
+    ----------
+    records : list of tuple
+        [(include, fields, is_large_field, is_free_field, comment), ...] (as yielded
+        by `fields_in_files`).
+
+    Returns
+    -------
+    CardBatch
+    """
+    includes, cards, large_field, free_field, comments = zip(*records)
+    n_fields = np.array([len(fields) for fields in cards])
+    fields = np.full((len(cards), n_fields.max()), '', dtype=object)
+
+    for index, card_fields in enumerate(cards):
+        fields[index, :len(card_fields)] = card_fields
+
+    ids = np.array([card_fields[1] if len(card_fields) > 1 and type(card_fields[1]) is int else -1 for
+                    card_fields in cards], dtype=np.int64)
+    return CardBatch(np.array([card_fields[0] for card_fields in cards], dtype=str), ids, fields,
+                     n_fields, np.array(large_field), np.array(free_field), np.array(comments, dtype=object),
+                     np.array(includes, dtype=object))
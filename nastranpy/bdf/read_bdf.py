@@ -1,11 +1,15 @@
 import os
 import re
+import mmap
+import locale
+from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
 from nastranpy.bdf.cards.card_factory import card_factory
 from nastranpy.bdf.cards.card import Card
+from nastranpy.bdf.misc import file_stamp, is_compressed, open_bdf
 
 
 def cards_in_file(file, card_names=None, raw_output=False, only_ids=False, ignore_comments=False,
-                  generic_cards=True, logger=None):
+                  generic_cards=True, logger=None, engine='text', id_index=None):
     """
     Get cards in file.
 
@@ -19,13 +23,24 @@ def cards_in_file(file, card_names=None, raw_output=False, only_ids=False, ignor
     only_ids : bool, optional
         Use this if only it is necessary to know the id of each card.
     raw_output : bool, optional
-        Whether or not process card fields.
+        Whether or not process card fields (nested includes are not followed in
+        this case, their INCLUDE cards are yielded anyway).
     ignore_comments : bool, optional
         Whether or not to ignore the comments in the file.
     generic_cards : bool, optional
         Whether or not to return a generic Card or the corresponding card object
         (i.e. GRID card).
     logger : Logger Object
+    engine : {'text', 'mmap'}, optional
+        Reading engine. 'text' reads the file line by line in text mode. 'mmap'
+        memory-maps the file and scans it as bytes, decoding only the lines of the
+        cards to be readed (much faster for huge files when `card_names` is used).
+        Compressed files ('.gz', '.xz' or '.zst') are decompressed on the fly and
+        always readed in text mode.
+    id_index : IdIndex, optional
+        Index of card ids used when `only_ids` is True, so files unchanged since they
+        were indexed are not readed again (cards without an integer id are skipped
+        and comments are not available in this case).
 
     Yields
     -------
@@ -40,173 +55,818 @@ def cards_in_file(file, card_names=None, raw_output=False, only_ids=False, ignor
     Examples
     --------
     >>> grids = [grid for grid in cards_in_file(f, ['GRID'])]
+
+    Get the ids of the elements in a file (and its nested includes), reusing the
+    ids indexed in previous calls:
+    >>> elem_ids = [fields for fields in cards_in_file(f, ['CQUAD4', 'CTRIA3'], only_ids=True,
+    ...                                                id_index=IdIndex())]
+    """
+
+    if only_ids and id_index:
+        records = id_index.get(file).fields(set(card_names) if card_names else None)
+    else:
+        records = fields_in_file(file, card_names, only_ids, ignore_comments, engine, not raw_output)
+
+    for fields, is_large_field, is_free_field, comment in records:
+
+        if only_ids and fields[0] != 'INCLUDE' or raw_output:
+            yield fields
+        else:
+
+            if generic_cards:
+                card = Card(fields, large_field=is_large_field, free_field=is_free_field)
+            else:
+                card = card_factory.get_card(fields, large_field=is_large_field, free_field=is_free_field)
+
+            card.include = file
+            card.comment = comment
+            yield card
+
+        if fields[0] == 'INCLUDE' and not raw_output:
+
+            try:
+
+                for card_in_file in cards_in_file(os.path.join(os.path.dirname(file), fields[1]),
+                                                  card_names, raw_output, only_ids, ignore_comments,
+                                                  generic_cards, logger, engine, id_index):
+                    yield card_in_file
+
+            except FileNotFoundError:
+
+                if logger:
+                    logger.warning("No such file: '{}'".format(fields[1]))
+                else:
+                    raise
+
+
+def fields_in_file(file, card_names=None, only_ids=False, ignore_comments=False, engine='text',
+                   convert_to_numbers=True):
+    """
+    Get the fields of the cards in file (nested includes are not followed).
+
+    Parameters
+    ----------
+    file : str
+        Include file path.
+    card_names : list of str, optional
+        Card names to read. Other cards will be ignored (the default is None, which
+        implies all cards will be readed).
+    only_ids : bool, optional
+        Use this if only it is necessary to know the id of each card.
+    ignore_comments : bool, optional
+        Whether or not to ignore the comments in the file.
+    engine : {'text', 'mmap'}, optional
+        Reading engine (see `cards_in_file`).
+    convert_to_numbers : bool, optional
+        Whether or not convert numeric fields to int or float.
+
+    Yields
+    -------
+    tuple
+        (fields, is_large_field, is_free_field, comment). If `only_ids` is True
+        fields are [card_name (str), card_id (int)] (except for INCLUDE cards).
     """
 
     if card_names:
         card_names = set(card_names)
 
-    card = list()
-    comment = ''
+    if engine == 'text' or engine == 'mmap' and is_compressed(file):
 
-    with open(file) as f:
-        comment_re = re.compile('^ *\$')
-        end_line_comment_re = re.compile(' *\$.*$')
-        card_name_re = re.compile('^[a-zA-Z]')
+        with open_bdf(file) as f:
+            yield from fields_in_lines(f, card_names, only_ids, ignore_comments, convert_to_numbers)
 
-        for line in f:
-            if comment_re.search(line):
-                comment += line
-            else:
-                line = end_line_comment_re.sub('', line)
+    elif engine == 'mmap':
 
-                if card_name_re.search(line):
+        with open(file, 'rb') as f:
 
-                    if card:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError: # Empty file
+                return
 
-                        if is_free_field:
-                            card = get_fields_from_free_field_string(card)
+            with mm:
+                yield from fields_in_lines(mmap_lines(mm, card_names, ignore_comments),
+                                           card_names, only_ids, ignore_comments, convert_to_numbers)
 
-                        if not raw_fields:
-                            card = process_fields(card, not raw_output)
+    else:
+        raise ValueError("Unknown engine: '{}'".format(engine))
 
-                        if raw_output:
-                            yield card
-                        else:
 
-                            if generic_cards:
-                                card = Card(card, large_field=is_large_field, free_field=is_free_field)
-                            else:
-                                card = card_factory.get_card(card, large_field=is_large_field, free_field=is_free_field)
+def fields_in_shard(file, start, end, card_names=None, ignore_comments=False):
+    """
+    Get the fields of the cards in a byte range of a file (see `file_shards`).
 
-                            card.include = file
-                            card.comment = card_comment
-                            yield card
+    Parameters
+    ----------
+    file : str
+        Include file path.
+    start : int
+        First byte of the range.
+    end : int
+        Byte just after the range.
+    card_names : list of str, optional
+        Card names to read (the default is None, which implies all cards will be
+        readed).
+    ignore_comments : bool, optional
+        Whether or not to ignore the comments in the range.
 
-                            if card.name == 'INCLUDE':
+    Yields
+    -------
+    tuple
+        (fields, is_large_field, is_free_field, comment)
+    """
 
-                                try:
+    if card_names:
+        card_names = set(card_names)
 
-                                    for card_in_file in cards_in_file(os.path.join(os.path.dirname(file), card.fields[1]),
-                                                                      card_names, raw_output, only_ids, ignore_comments,
-                                                                      generic_cards, logger):
-                                        yield card_in_file
+    with open_bdf(file, 'rb') as f:
+        f.seek(start)
+        contents = f.read(end - start)
 
-                                except FileNotFoundError:
+    yield from fields_in_lines(mmap_lines(contents, card_names, ignore_comments),
+                               card_names, ignore_comments=ignore_comments)
 
-                                    if logger:
-                                        logger.warning("No such file: '{}'".format(card.fields[1]))
-                                    else:
-                                        raise
 
-                    if ignore_comments:
-                        card_comment = ''
-                    else:
-                        card_comment = comment
+def file_shards(file, shard_size, card_start_re=re.compile(b'^[a-zA-Z]', re.MULTILINE)):
+    """
+    Split a file into byte ranges of about `shard_size` bytes that can be readed on
+    their own (i.e. in parallel).
 
-                    comment = ''
-                    card = list()
-                    fields_from_empty_lines = list()
-                    card_name = line[:8].strip()
-                    card_id = line[8:16].strip()
-                    is_free_field = False
-                    is_large_field = False
-                    field_length = 8
-                    n_fields = 8
-                    raw_fields = False
+    Each range starts at the first line of a card (a line starting with a letter),
+    or rather at the comment and blank lines just before it, so comments are still
+    attached to the card that follows them and continuation lines are never
+    separated from their card.
 
-                    if ',' in line[:8]: # Free-field format
-                        is_free_field = True
-                        card_name, card_id = line.split(',')[:2]
+    Parameters
+    ----------
+    file : str
+        Include file path.
+    shard_size : int
+        Approximate size of each range in bytes.
 
-                    if card_name[-1] == '*': # Large-field format
-                        is_large_field = True
-                        field_length = 16
-                        n_fields = 4
-                        card_name = card_name[:-1]
-                        card_id = line[8:24].strip()
+    Returns
+    -------
+    list of tuple
+        [(start, end), ...] covering the whole file in order.
+    """
+    size = os.path.getsize(file)
+    starts = [0]
 
-                    card_name = card_name.upper()
+    if size > shard_size:
 
-                    if card_name == 'INCLUDE':
-                        card = [card_name, line[8:-1].replace("'", "").strip()]
-                        raw_fields = True
-                        continue
+        with open(file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
 
-                    if not card_names or card_name in card_names:
+            offset = shard_size
 
-                        if only_ids:
-                            yield [card_name, int(card_id)]
-                            continue
+            while offset < size:
+                match = card_start_re.search(mm, offset)
 
-                        if is_free_field:
-                            card = line[:-1]
-                        else:
-                            card = [card_name] + [line[:-1][8 + i * field_length:8 + (i + 1) * field_length] for i in range(n_fields)]
+                if not match:
+                    break
 
-                elif card:
+                start = match.start()
 
-                    if card_name == 'INCLUDE':
-                        card[-1] += line[:-1].replace("'", "").strip()
-                        continue
+                while start > 0: # Comment and blank lines before the card
+                    line_start = mm.rfind(b'\n', 0, start - 1) + 1
+                    line = mm[line_start:start]
 
-                    if not line[:-1].strip():
-                        fields_from_empty_lines += ['' for i in range(8)]
-                        continue
+                    if line.strip() and line.lstrip(b' ')[:1] != b'$':
+                        break
 
-                    comment = ''
+                    start = line_start
 
-                    if line[0] == '*':
-                        is_large_field = True
-                        field_length = 16
-                        n_fields = 4
-                    else:
-                        field_length = 8
-                        n_fields = 8
+                if start > starts[-1]:
+                    starts.append(start)
+                    offset = start + shard_size
+                else: # Only comments since the previous range start
+                    offset = match.end()
 
-                    if is_free_field:
-                        card += line[:-1]
+    return [(start, end) for start, end in zip(starts, starts[1:] + [size])]
+
+
+def read_include(file, card_names=None, ignore_comments=False, engine='text', shard=None):
+    """
+    Get the fields of all the cards in file (nested includes are not followed).
+
+    Parameters
+    ----------
+    file : str
+        Include file path.
+    card_names : list of str, optional
+        Card names to read (the default is None, which implies all cards will be
+        readed).
+    ignore_comments : bool, optional
+        Whether or not to ignore the comments in the file.
+    engine : {'text', 'mmap'}, optional
+        Reading engine (see `cards_in_file`).
+    shard : tuple of int, optional
+        (start, end) byte range of the file to read, as given by `file_shards` (the
+        default is None, which implies the whole file will be readed). `engine` is
+        not used in this case.
+
+    Returns
+    -------
+    list of tuple
+        [(fields, is_large_field, is_free_field, comment), ...]
+    """
+
+    if shard:
+        return list(fields_in_shard(file, *shard, card_names, ignore_comments))
+
+    return list(fields_in_file(file, card_names, ignore_comments=ignore_comments, engine=engine))
+
+
+def fields_in_files(files, card_names=None, ignore_comments=False, engine='text', workers=None,
+                    shard_size=2 ** 26, cache=None, skipped_files=None, logger=None):
+    """
+    Get the fields of the cards in several files, following nested includes.
+
+    Cards are yielded in the same order as `cards_in_file` would do it file by file,
+    no matter whether the files are parsed in parallel or not.
+
+    Parameters
+    ----------
+    files : list of str
+        Include file paths.
+    card_names : list of str, optional
+        Card names to read (the default is None, which implies all cards will be
+        readed).
+    ignore_comments : bool, optional
+        Whether or not to ignore the comments in the files.
+    engine : {'text', 'mmap'}, optional
+        Reading engine (see `cards_in_file`).
+    workers : int, optional
+        Number of worker processes used to parse the files (the default is None,
+        which implies the files are parsed one after another in this process).
+    shard_size : int, optional
+        Files bigger than this (in bytes) are split into ranges of about this size
+        (see `file_shards`) parsed in parallel too, so a single huge include file
+        benefits from `workers` as well (the default is 64 MB). Use None not to split
+        the files.
+    cache : IncludeCache, optional
+        Cache of parsed include files. Unchanged files are loaded from it and the
+        rest are parsed and stored in it.
+    skipped_files : set of str, optional
+        Nested include files not to be followed (i.e. already readed ones). Their
+        INCLUDE cards are yielded anyway.
+    logger : Logger Object
+
+    Yields
+    -------
+    tuple
+        (include, fields, is_large_field, is_free_field, comment). An INCLUDE card
+        (with `include` set to None) is yielded before the cards of each file in
+        `files`.
+    """
+
+    def walk(file):
+
+        for fields, is_large_field, is_free_field, comment in get_fields(file):
+            yield file, fields, is_large_field, is_free_field, comment
+
+            if fields[0] == 'INCLUDE':
+                nested_file = os.path.join(os.path.dirname(file), fields[1])
+
+                if skipped_files and nested_file in skipped_files:
+                    continue
+
+                try:
+                    yield from walk(nested_file)
+                except FileNotFoundError:
+
+                    if logger:
+                        logger.warning("No such file: '{}'".format(fields[1]))
                     else:
-                        card += fields_from_empty_lines
-                        fields_from_empty_lines = list()
-                        card += [line[:-1][8 + i * field_length:8 + (i + 1) * field_length] for i in range(n_fields)]
+                        raise
 
-        if card:
+    if not workers:
 
-            if is_free_field:
-                card = get_fields_from_free_field_string(card)
+        def get_fields(file):
 
-            if not raw_fields:
-                card = process_fields(card, not raw_output)
+            if not cache:
+                return fields_in_file(file, card_names, ignore_comments=ignore_comments, engine=engine)
 
-            if raw_output:
-                yield card
-            else:
+            cards = cache.get(file, card_names, ignore_comments)
+
+            if cards is None:
+                stamp = file_stamp(file)
+                cards = read_include(file, card_names, ignore_comments, engine)
+                cache.set(file, cards, card_names, ignore_comments, stamp)
+
+            return cards
+
+        for file in files:
+            yield None, ['INCLUDE', file], False, False, ''
+            yield from walk(file)
+
+        return
+
+    with ProcessPoolExecutor(workers) as executor:
+        futures = dict()
+        scanned_files = set()
+        stamps = dict() # Files to be cached
 
-                if generic_cards:
-                    card = Card(card, large_field=is_large_field, free_field=is_free_field)
+        def submit(file):
+
+            if not file in futures:
+                cards = cache.get(file, card_names, ignore_comments) if cache else None
+
+                if cards is None:
+
+                    if cache:
+
+                        try:
+                            stamps[file] = file_stamp(file)
+                        except FileNotFoundError:
+                            pass
+
+                    shards = [None]
+
+                    if shard_size:
+
+                        try:
+
+                            if os.path.getsize(file) > shard_size and not is_compressed(file):
+                                shards = file_shards(file, shard_size)
+
+                        except FileNotFoundError: # Raised again by the worker
+                            pass
+
+                    futures[file] = [executor.submit(read_include, os.path.abspath(file), card_names,
+                                                     ignore_comments, engine, shard) for shard in shards]
                 else:
-                    card = card_factory.get_card(card, large_field=is_large_field, free_field=is_free_field)
+                    future = Future()
+                    future.set_result(cards)
+                    futures[file] = [future]
 
-                card.include = file
-                card.comment = card_comment
-                yield card
+        def is_done(file):
+            return all(future.done() for future in futures[file])
 
-                if card.name == 'INCLUDE':
+        def get_fields(file):
+            # Nested includes are submitted as soon as their parent file is parsed
+            submit(file)
 
-                    try:
+            while True:
+
+                for parsed_file in [parsed_file for parsed_file in futures if
+                                    is_done(parsed_file) and not parsed_file in scanned_files]:
+                    scanned_files.add(parsed_file)
+
+                    if not any(future.exception() for future in futures[parsed_file]):
+
+                        for future in futures[parsed_file]:
+
+                            for fields, _, _, _ in future.result():
+
+                                if fields[0] == 'INCLUDE':
+                                    nested_file = os.path.join(os.path.dirname(parsed_file), fields[1])
+
+                                    if not skipped_files or not nested_file in skipped_files:
+                                        submit(nested_file)
+
+                if is_done(file):
 
-                        for card_in_file in cards_in_file(os.path.join(os.path.dirname(file), card.fields[1]),
-                                                          card_names, raw_output, only_ids, ignore_comments,
-                                                          generic_cards, logger):
-                            yield card_in_file
+                    if len(futures[file]) == 1:
+                        cards = futures[file][0].result()
+                    else: # Shards merged in the original order
+                        cards = [card for future in futures[file] for card in future.result()]
 
+                    if file in stamps:
+                        cache.set(file, cards, card_names, ignore_comments, stamps.pop(file))
+
+                    return cards
+
+                wait([future for parsed_file in futures if not parsed_file in scanned_files for
+                      future in futures[parsed_file]], return_when=FIRST_COMPLETED)
+
+        for file in files:
+            submit(file)
+
+        for file in files:
+            yield None, ['INCLUDE', file], False, False, ''
+            yield from walk(file)
+
+
+def index_files(files, card_names=None, indexed_names=None, logger=None):
+    """
+    Locate the cards in several files (following nested includes), reading only
+    the cards not to be indexed.
+
+    Parameters
+    ----------
+    files : list of str
+        Include file paths.
+    card_names : list of str, optional
+        Card names to read (the default is None, which implies all cards will be
+        readed).
+    indexed_names : set of str, optional
+        Card names to be located instead of readed.
+    logger : Logger Object
+
+    Yields
+    -------
+    tuple
+        (include, fields, is_large_field, is_free_field, comment, location). For
+        indexed cards fields are [card_name, card_id] and location is (offset, size)
+        of the card record in the file (None for the rest of the cards). An INCLUDE
+        card (with `include` set to None) is yielded before the cards of each file
+        in `files`.
+    """
+
+    if card_names:
+        card_names = set(card_names)
+
+    def walk(file):
+
+        for card_name, card_id, offset, size, contents in card_records(file, card_names, indexed_names):
+
+            if contents is None:
+                yield file, [card_name, card_id], None, None, None, (offset, size)
+                continue
+
+            for fields, is_large_field, is_free_field, comment in fields_in_lines(mmap_lines(contents)):
+                yield file, fields, is_large_field, is_free_field, comment, None
+
+                if fields[0] == 'INCLUDE':
+
+                    try:
+                        yield from walk(os.path.join(os.path.dirname(file), fields[1]))
                     except FileNotFoundError:
 
                         if logger:
-                            logger.warning("No such file: '{}'".format(card.fields[1]))
+                            logger.warning("No such file: '{}'".format(fields[1]))
                         else:
                             raise
 
+    for file in files:
+        yield None, ['INCLUDE', file], False, False, '', None
+        yield from walk(file)
+
+
+def card_records(file, card_names=None, indexed_names=None, encoding=None):
+    """
+    Locate the cards in a file (nested includes are not followed).
+
+    Each card record spans the comment lines just before the card and the card
+    lines, so it can be readed on its own afterwards.
+
+    Parameters
+    ----------
+    file : str
+        Include file path.
+    card_names : set of str, optional
+        Card names to locate (the default is None, which implies all cards will be
+        located).
+    indexed_names : set of str, optional
+        Card names whose records are not needed (only their location).
+    encoding : str, optional
+        File encoding (the default is None, which implies the same encoding used by
+        `open` in text mode).
+
+    Yields
+    -------
+    tuple
+        (card_name, card_id, offset, size, contents). `contents` are the bytes of the
+        card record (None for indexed cards with an integer id).
+    """
+
+    if not encoding:
+        encoding = locale.getpreferredencoding(False)
+
+    record = None
+    lines = list() # Lines not assigned to any record yet
+    lines_offset = None
+    offset = 0
+
+    def get_record(end):
+        card_name, card_id, start, record_lines = record
+        return card_name, card_id, start, end - start, None if record_lines is None else b''.join(record_lines)
+
+    with open_bdf(file, 'rb') as f:
+
+        for line in f:
+
+            if line[:1].isalpha(): # New card
+                start = offset if lines_offset is None else lines_offset
+
+                if record:
+                    yield get_record(start)
+
+                card_name, card_id = get_card_name_id(line.decode(encoding))
+
+                if card_names and not card_name in card_names and card_name != 'INCLUDE':
+                    record = None
+                elif indexed_names and card_name in indexed_names and isinstance(card_id, int):
+                    record = [card_name, card_id, start, None]
+                else:
+                    lines.append(line)
+                    record = [card_name, card_id, start, lines]
+
+                lines = list()
+                lines_offset = None
+            else:
+
+                if lines_offset is None:
+                    lines_offset = offset
+
+                lines.append(line)
+
+                if line.strip() and line.lstrip(b' ')[:1] != b'$': # Card continuation
+                    lines_offset = None
+
+                    if record and not record[3] is None:
+                        record[3] += lines
+
+                    lines = list()
+
+            offset += len(line)
+
+    if record:
+        yield get_record(offset)
+
+
+def get_card_name_id(line, end_line_comment_re=re.compile(' *\$.*$')):
+    """
+    Get the name and the id of a card from its first line.
+
+    Parameters
+    ----------
+    line : str
+        First line of the card.
+
+    Returns
+    -------
+    tuple
+        (card_name, card_id). `card_id` is an int or a str (if it is not an integer).
+    """
+
+    if '$' in line:
+        line = end_line_comment_re.sub('', line)
+
+    card_name = line[:8].strip()
+    card_id = line[8:16]
+
+    if ',' in line[:8]: # Free-field format
+        card_name, card_id = line.split(',')[:2]
+
+    if card_name[-1] == '*': # Large-field format
+        card_name = card_name[:-1]
+        card_id = line[8:24]
+
+    try:
+        card_id = int(card_id)
+    except ValueError:
+        card_id = card_id.strip()
+
+    return card_name.upper(), card_id
+
+
+def fields_in_lines(lines, card_names=None, only_ids=False, ignore_comments=False,
+                    convert_to_numbers=True, end_line_comment_re=re.compile(' *\$.*$'),
+                    letters=frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ')):
+    """
+    Get the fields of the cards in a sequence of lines.
+
+    Parameters
+    ----------
+    lines : iterable of str
+        Lines (with their trailing newline). A None item stands for the first line
+        of a card not to be readed.
+    card_names : set of str, optional
+        Card names to read (the default is None, which implies all cards will be
+        readed).
+    only_ids : bool, optional
+        Use this if only it is necessary to know the id of each card.
+    ignore_comments : bool, optional
+        Whether or not to ignore the comments.
+    convert_to_numbers : bool, optional
+        Whether or not convert numeric fields to int or float.
+
+    Yields
+    -------
+    tuple
+        (fields, is_large_field, is_free_field, comment)
+    """
+    card = list()
+    comment = ''
+
+    for line in lines:
+
+        if line is None: # Card not to be readed
+
+            if card:
+                yield get_card_fields(card, is_free_field, raw_fields, convert_to_numbers), is_large_field, is_free_field, card_comment
+
+            card = list()
+            comment = ''
+        elif line.lstrip(' ')[:1] == '$':
+            comment += line
+        else:
+
+            if '$' in line:
+                line = end_line_comment_re.sub('', line)
+
+            if line[:1] in letters:
+
+                if card:
+                    yield get_card_fields(card, is_free_field, raw_fields, convert_to_numbers), is_large_field, is_free_field, card_comment
+
+                if ignore_comments:
+                    card_comment = ''
+                else:
+                    card_comment = comment
+
+                comment = ''
+                card = list()
+                fields_from_empty_lines = list()
+                card_name = line[:8].strip()
+                card_id = line[8:16].strip()
+                is_free_field = False
+                is_large_field = False
+                field_length = 8
+                n_fields = 8
+                raw_fields = False
+
+                if ',' in line[:8]: # Free-field format
+                    is_free_field = True
+                    card_name, card_id = line.split(',')[:2]
+
+                if card_name[-1] == '*': # Large-field format
+                    is_large_field = True
+                    field_length = 16
+                    n_fields = 4
+                    card_name = card_name[:-1]
+                    card_id = line[8:24].strip()
+
+                card_name = card_name.upper()
+
+                if card_name == 'INCLUDE':
+                    card = [card_name, line[8:-1].replace("'", "").strip()]
+                    raw_fields = True
+                    continue
+
+                if not card_names or card_name in card_names:
+
+                    if only_ids:
+                        yield [card_name, int(card_id)], is_large_field, is_free_field, card_comment
+                        continue
+
+                    if is_free_field:
+                        card = line[:-1]
+                    else:
+                        card = [card_name] + [line[:-1][8 + i * field_length:8 + (i + 1) * field_length] for i in range(n_fields)]
+
+            elif card:
+
+                if card_name == 'INCLUDE':
+                    card[-1] += line[:-1].replace("'", "").strip()
+                    continue
+
+                if not line[:-1].strip():
+                    fields_from_empty_lines += ['' for i in range(8)]
+                    continue
+
+                comment = ''
+
+                if line[0] == '*':
+                    is_large_field = True
+                    field_length = 16
+                    n_fields = 4
+                else:
+                    field_length = 8
+                    n_fields = 8
+
+                if is_free_field:
+                    card += line[:-1]
+                else:
+                    card += fields_from_empty_lines
+                    fields_from_empty_lines = list()
+                    card += [line[:-1][8 + i * field_length:8 + (i + 1) * field_length] for i in range(n_fields)]
+
+    if card:
+        yield get_card_fields(card, is_free_field, raw_fields, convert_to_numbers), is_large_field, is_free_field, card_comment
+
+
+def get_card_fields(card, is_free_field, raw_fields, convert_to_numbers):
+
+    if is_free_field:
+        card = get_fields_from_free_field_string(card)
+
+    if not raw_fields:
+        card = process_fields(card, convert_to_numbers)
+
+    return card
+
+
+def mmap_lines(mm, card_names=None, ignore_comments=False, encoding=None, chunk_size=2 ** 24,
+               other_line_breaks_re=re.compile('[\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]')):
+    """
+    Get the lines of a memory-mapped file needed to read the requested cards.
+
+    The file is scanned as bytes looking for blocks of consecutive cards that may
+    be requested, so the rest of the cards are skipped without being decoded (each
+    skipped block is replaced by a single None). Only the comments just before a
+    block are kept, as they are attached to its first card.
+
+    Parameters
+    ----------
+    mm : mmap.mmap or bytes
+        File contents.
+    card_names : set of str, optional
+        Card names to read (the default is None, which implies all cards will be
+        readed).
+    ignore_comments : bool, optional
+        Whether or not to skip the comments.
+    encoding : str, optional
+        File encoding (the default is None, which implies the same encoding used by
+        `open` in text mode).
+    chunk_size : int, optional
+        Maximum number of bytes decoded at once.
+
+    Yields
+    -------
+    str or None
+        Line (with universal newlines, as in text mode).
+    """
+    size = len(mm)
+
+    if not encoding:
+        encoding = locale.getpreferredencoding(False)
+
+    def decoded_lines(start, end):
+
+        while start < end:
+            chunk_end = min(start + chunk_size, end)
+
+            if chunk_end < end:
+                chunk_end = mm.rfind(b'\n', start, chunk_end) + 1 or mm.find(b'\n', chunk_end, end) + 1 or end
+
+            text = mm[start:chunk_end].decode(encoding)
+
+            if '\r' in text:
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+
+            if other_line_breaks_re.search(text):
+                lines = text.split('\n')
+                last_line = lines.pop()
+                yield from (line + '\n' for line in lines)
+
+                if last_line:
+                    yield last_line
+
+            else:
+                yield from text.splitlines(True)
+
+            start = chunk_end
+
+    def comment_lines(end):
+        lines = list()
+
+        while end > 0:
+            start = mm.rfind(b'\n', 0, end - 1) + 1
+
+            if mm[start:start + 1].isalpha(): # Previous card
+                break
+
+            if mm[start:end].lstrip(b' ')[:1] == b'$':
+                lines.append((start, end))
+
+            end = start
+
+        for start, end in reversed(lines):
+            yield from decoded_lines(start, end)
+
+    if not card_names:
+        yield from decoded_lines(0, size)
+        return
+
+    # A card may be requested only if its first line starts with a requested card name
+    # followed by the end of the name (unless the name fills the whole name field)
+    card_names_re = b'|'.join(re.escape(card_name) + (b'' if len(card_name) >= 8 else b'(?:[ *,\r\n$]|\\Z)') for
+                              card_name in sorted({card_name.encode() for card_name in card_names} | {b'INCLUDE'},
+                                                  key=len, reverse=True))
+    candidate_re = re.compile(b'^(?:' + card_names_re + b')', re.MULTILINE | re.IGNORECASE)
+    non_candidate_re = re.compile(b'^(?!' + card_names_re + b')[a-zA-Z]', re.MULTILINE | re.IGNORECASE)
+    end = 0
+
+    while True:
+        match = candidate_re.search(mm, end)
+
+        if not match:
+            break
+
+        start = match.start()
+
+        if start:
+            yield None
+
+            if not ignore_comments:
+                yield from comment_lines(start)
+
+        match = non_candidate_re.search(mm, start)
+        end = match.start() if match else size
+        yield from decoded_lines(start, end)
+
 
 def get_fields_from_free_field_string(free_field_string):
     fields = [field for field in (x.strip() for x in free_field_string.split(',')) if
@@ -222,18 +882,24 @@ def process_fields(fields, convert_to_numbers, nastran_exp_re=re.compile('(.+[^E
     processed_fields = list()
 
     for field in fields:
-        field = field.strip().upper()
 
-        if convert_to_numbers:
+        if convert_to_numbers and '.' in field:
 
-            if '.' in field:
+            try: # Most real fields are valid Python floats (no need of stripping them)
+                field = float(field)
+            except ValueError:
+                field = field.strip().upper()
                 nastran_exp_match = nastran_exp_re.search(field)
 
                 if nastran_exp_match:
                     field = nastran_exp_match.group(1) + 'E' + nastran_exp_match.group(2)
 
                 field = float(field)
-            elif field.isdigit():
+
+        else:
+            field = field.strip().upper()
+
+            if convert_to_numbers and field.isdigit():
                 field = int(field)
 
         processed_fields.append(field)
@@ -0,0 +1,486 @@
+import os
+import numpy as np
+from nastranpy.bdf.read_bdf import fields_in_lines, process_fields
+from nastranpy.bdf.misc import open_bdf
+from nastranpy.bdf.cards.card_factory import card_factory
+
+
+bulk_card_names = ('GRID', 'CQUAD4', 'CTRIA3', 'CBAR', 'CHEXA')
+bulk_card_lines = {'GRID': 1, 'CQUAD4': 1, 'CTRIA3': 1, 'CBAR': 1, 'CHEXA': 2}
+
+
+class BulkCards(object):
+
+    def __init__(self, name, columns):
+        """
+        Initialize a BulkCards instance (cards of the same name stored by columns).
+
+        Parameters
+        ----------
+        name : str
+            Card name.
+        columns : dict of numpy.ndarray
+            Card fields (one row per card):
+
+            GRID: 'id', 'CP', 'xyz' (n x 3) and 'CD'
+            CQUAD4, CTRIA3, CHEXA: 'id', 'prop' and 'grids' (n x 4, n x 3, n x 8)
+            CBAR: 'id', 'prop', 'grids' (n x 2), 'v' (n x 3) and 'G0'
+
+            Blank coordinate systems and G0 are stored as 0 (and v as NaN if G0 is
+            used instead).
+        """
+        self.name = name
+        self.columns = columns
+
+    def __repr__(self):
+        return "<{} {} cards>".format(len(self), self.name)
+
+    def __len__(self):
+        return len(self.columns['id'])
+
+    @property
+    def ids(self):
+        return self.columns['id']
+
+    def get_fields(self, index):
+        """
+        Get the fields of a card (as readed by `cards_in_file`).
+
+        Parameters
+        ----------
+        index : int
+            Card index.
+
+        Returns
+        -------
+        list of int, float or str
+            Card fields.
+        """
+        columns = self.columns
+        fields = [self.name, int(columns['id'][index])]
+
+        if self.name == 'GRID':
+            fields.append(int(columns['CP'][index]) or '')
+            fields += [float(x) for x in columns['xyz'][index]]
+            fields.append(int(columns['CD'][index]) or '')
+        else:
+            fields.append(int(columns['prop'][index]))
+            fields += [int(grid) for grid in columns['grids'][index]]
+
+            if self.name == 'CBAR':
+
+                if columns['G0'][index]:
+                    fields += [int(columns['G0'][index]), '', '']
+                else:
+                    fields += [float(x) for x in columns['v'][index]]
+
+        return fields
+
+    def get_card(self, index):
+        """
+        Build a card (not linked to any model yet).
+
+        Parameters
+        ----------
+        index : int
+            Card index.
+
+        Returns
+        -------
+        Card
+            Card object.
+        """
+        return card_factory.get_card(self.get_fields(index))
+
+    def cards(self):
+        """
+        Build all the cards.
+
+        Yields
+        -------
+        Card
+            Card object.
+        """
+        yield from (self.get_card(index) for index in range(len(self)))
+
+
+def bulk_cards_in_file(file, card_names=None):
+    """
+    Read GRID, CQUAD4, CTRIA3, CBAR and CHEXA cards of a file into NumPy arrays.
+
+    Only small-field cards without comments nor optional fields are readed (see
+    `parse_bulk`).
+
+    Parameters
+    ----------
+    file : str
+        Include file path.
+    card_names : list of str, optional
+        Card names to read (the default is None, which implies all the supported
+        cards will be readed).
+
+    Returns
+    -------
+    dict of BulkCards
+        Cards by card name.
+
+    Examples
+    --------
+    >>> grids = bulk_cards_in_file('grids.bdf')['GRID']
+    >>> grids.columns['xyz'].mean(axis=0)
+    """
+
+    with open_bdf(file) as f:
+        return parse_bulk(f.readlines(), card_names)[0]
+
+
+def bulk_fields_in_file(file, card_names=None, ignore_comments=False):
+    """
+    Get the fields of the cards in a file, reading GRID, CQUAD4, CTRIA3, CBAR and
+    CHEXA cards in bulk (nested includes are not followed).
+
+    Parameters
+    ----------
+    file : str
+        Include file path.
+    card_names : list of str, optional
+        Card names to read (the default is None, which implies all cards will be
+        readed).
+    ignore_comments : bool, optional
+        Whether or not to ignore the comments in the file.
+
+    Yields
+    -------
+    tuple
+        (fields, is_large_field, is_free_field, comment, location). For cards readed
+        in bulk fields are [card_name, card_id] and location is (BulkCards, index)
+        (None for the rest of the cards).
+    """
+
+    if card_names:
+        card_names = set(card_names)
+
+    with open_bdf(file) as f:
+        bulk_cards, sequence = parse_bulk(f.readlines(), card_names)
+
+    for name, *item in sequence:
+
+        if name is None:
+
+            for fields, is_large_field, is_free_field, comment in fields_in_lines(item[0], card_names,
+                                                                                ignore_comments=ignore_comments):
+                yield fields, is_large_field, is_free_field, comment, None
+
+        else:
+            start, stop = item
+            ids = bulk_cards[name].ids[start:stop].tolist()
+
+            for index, card_id in enumerate(ids, start):
+                yield [name, card_id], False, False, '', (bulk_cards[name], index)
+
+
+def bulk_fields_in_files(files, card_names=None, ignore_comments=False, logger=None):
+    """
+    Get the fields of the cards in several files (following nested includes),
+    reading GRID, CQUAD4, CTRIA3, CBAR and CHEXA cards in bulk.
+
+    Parameters
+    ----------
+    files : list of str
+        Include file paths.
+    card_names : list of str, optional
+        Card names to read (the default is None, which implies all cards will be
+        readed).
+    ignore_comments : bool, optional
+        Whether or not to ignore the comments in the files.
+    logger : Logger Object
+
+    Yields
+    -------
+    tuple
+        (include, fields, is_large_field, is_free_field, comment, location) (see
+        `bulk_fields_in_file`). An INCLUDE card (with `include` set to None) is
+        yielded before the cards of each file in `files`.
+    """
+
+    def walk(file):
+
+        for fields, is_large_field, is_free_field, comment, location in bulk_fields_in_file(file, card_names,
+                                                                                            ignore_comments):
+            yield file, fields, is_large_field, is_free_field, comment, location
+
+            if fields[0] == 'INCLUDE':
+
+                try:
+                    yield from walk(os.path.join(os.path.dirname(file), fields[1]))
+                except FileNotFoundError:
+
+                    if logger:
+                        logger.warning("No such file: '{}'".format(fields[1]))
+                    else:
+                        raise
+
+    for file in files:
+        yield None, ['INCLUDE', file], False, False, '', None
+        yield from walk(file)
+
+
+def parse_bulk(lines, card_names=None,
+               letters=frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ')):
+    """
+    Split a sequence of lines into cards readed in bulk and the rest of lines.
+
+    A card is readed in bulk if it is a GRID, CQUAD4, CTRIA3, CBAR or CHEXA (8
+    grids) in small-field format, with no comments before or within it and no
+    continuation or optional fields (PS, SEID, THETA, ZOFFS, OFFT, ...).
+
+    Parameters
+    ----------
+    lines : list of str
+        Lines (with their trailing newline).
+    card_names : set of str, optional
+        Card names to read (the default is None, which implies all cards will be
+        readed).
+
+    Returns
+    -------
+    dict of BulkCards
+        Cards readed in bulk by card name.
+    list of tuple
+        Sequence of (card_name, start, stop) for runs of cards readed in bulk (index
+        range in BulkCards) and (None, lines) for the rest of lines, in the same
+        order as in `lines`.
+    """
+    names = {name.ljust(8): name for name in bulk_card_names if not card_names or name in card_names}
+    rows = {name: list() for name in names.values()} # Card lines
+    runs = list() # [card_name, start, stop] (rows) or [None, lines]
+    other_lines = list()
+    is_commented = False
+    n = len(lines)
+    i = 0
+
+    def is_continuation(line):
+        return (line[:1] not in letters and line.strip() and line.lstrip(' ')[:1] != '$' and
+                not '$' in line and line.isascii())
+
+    def is_card_end(j):
+
+        while j < n and (lines[j].lstrip(' ')[:1] == '$' or not lines[j].strip()):
+            j += 1
+
+        return j == n or lines[j][:1] in letters
+
+    while i < n:
+        line = lines[i]
+        name = names.get(line[:8])
+
+        if name and not is_commented and not '$' in line and line.isascii():
+            j = i + bulk_card_lines[name]
+
+            if ((j == i + 1 or j <= n and all(is_continuation(lines[k]) for k in range(i + 1, j))) and
+                (j < n and lines[j][:1] in letters or is_card_end(j))):
+                row = len(rows[name]) // (j - i)
+
+                if j == i + 1:
+                    rows[name].append(line)
+                else:
+                    rows[name] += lines[i:j]
+
+                if other_lines:
+                    runs.append([None, other_lines])
+                    other_lines = list()
+
+                if runs and runs[-1][0] == name and runs[-1][2] == row:
+                    runs[-1][2] += 1
+                else:
+                    runs.append([name, row, row + 1])
+
+                i = j
+                continue
+
+        if line.lstrip(' ')[:1] == '$':
+            is_commented = True
+        elif line.strip():
+            is_commented = False
+
+        other_lines.append(line)
+        i += 1
+
+    if other_lines:
+        runs.append([None, other_lines])
+
+    bulk_cards = dict()
+    indexes = dict()
+
+    for name, name_rows in rows.items():
+
+        if name_rows:
+            bulk_cards[name], indexes[name] = get_bulk_cards(name, name_rows)
+
+    sequence = list()
+
+    for name, start, *stop in runs:
+
+        if name is None:
+            sequence.append((None, start))
+            continue
+
+        index = indexes[name][start:stop[0]]
+
+        if index[0] >= 0 and index[-1] - index[0] == stop[0] - start - 1:
+            sequence.append((name, int(index[0]), int(index[-1]) + 1))
+        else: # Cards not valid for a bulk read are readed as usual
+            n_lines = bulk_card_lines[name]
+
+            for row in range(start, stop[0]):
+
+                if indexes[name][row] < 0:
+                    sequence.append((None, rows[name][row * n_lines:(row + 1) * n_lines]))
+                else:
+                    sequence.append((name, int(indexes[name][row]), int(indexes[name][row]) + 1))
+
+    return bulk_cards, sequence
+
+
+def get_bulk_cards(name, lines):
+    """
+    Convert the lines of the cards of the same name into NumPy arrays.
+
+    Parameters
+    ----------
+    name : str
+        Card name.
+    lines : list of str
+        Card lines (ASCII only).
+
+    Returns
+    -------
+    BulkCards
+        Valid cards.
+    numpy.ndarray
+        Index of each card in BulkCards (-1 for the cards not valid for a bulk read).
+    """
+    n_lines = bulk_card_lines[name]
+    n_cards = len(lines) // n_lines
+    chars = np.array(lines, dtype='S80').view(np.uint8).reshape(len(lines), 80)
+    chars[(chars == 0) | (chars == 10)] = 32 # Lines padded with spaces
+    fields = chars.reshape(n_cards, 80 * n_lines).view('S8')
+    blank = b' ' * 8
+    columns = dict()
+    is_valid = np.ones(n_cards, dtype=bool)
+
+    def field(index):
+        return fields[:, 1 + index + 2 * (index // 8)] # Fields 0 and 9 of each line are skipped
+
+    def int_column(index, allow_blank=False):
+        values, is_valid_column = get_int_column(field(index), allow_blank)
+        is_valid[:] &= is_valid_column
+        return values
+
+    def float_column(index):
+        values, is_valid_column = get_float_column(field(index))
+        is_valid[:] &= is_valid_column
+        return values
+
+    def blank_column(index):
+        is_valid[:] &= field(index) == blank
+
+    columns['id'] = int_column(0)
+
+    if name == 'GRID':
+        columns['CP'] = int_column(1, allow_blank=True)
+        columns['xyz'] = np.column_stack([float_column(2), float_column(3), float_column(4)])
+        is_valid &= (field(2) != blank) | (field(3) != blank) | (field(4) != blank)
+        columns['CD'] = int_column(5, allow_blank=True)
+        blank_column(6)
+        blank_column(7)
+    else:
+        n_grids = {'CQUAD4': 4, 'CTRIA3': 3, 'CBAR': 2, 'CHEXA': 8}[name]
+        columns['prop'] = int_column(1)
+        columns['grids'] = np.column_stack([int_column(2 + i) for i in range(n_grids)])
+
+        if name == 'CBAR':
+            x1 = field(4)
+            is_vector = np.char.find(x1, b'.') >= 0
+            G0, is_valid_G0 = get_int_column(x1)
+            x = [get_float_column(field(index)) for index in (4, 5, 6)]
+            is_valid &= np.where(is_vector, x[0][1], is_valid_G0 & (field(5) == blank) & (field(6) == blank))
+            is_valid &= x[1][1] & x[2][1]
+            columns['G0'] = np.where(is_vector, 0, G0)
+            columns['v'] = np.column_stack([x[0][0], x[1][0], x[2][0]])
+            columns['v'][~is_vector] = np.nan
+            blank_column(7)
+        else:
+
+            for index in range(2 + n_grids, 8 * n_lines):
+                blank_column(index)
+
+    indexes = np.full(n_cards, -1)
+    indexes[is_valid] = np.arange(np.count_nonzero(is_valid))
+    return BulkCards(name, {key: value[is_valid] for key, value in columns.items()}), indexes
+
+
+def get_int_column(column, allow_blank=False):
+    """
+    Convert a column of fixed-width fields into integers.
+
+    Parameters
+    ----------
+    column : numpy.ndarray
+        Fields (bytes).
+    allow_blank : bool, optional
+        Whether or not blank fields are valid (converted to 0). Explicit zeros are
+        not valid then, so blank fields can be told apart.
+
+    Returns
+    -------
+    numpy.ndarray
+        Values.
+    numpy.ndarray
+        Whether or not each field is a valid integer (as in `process_fields`).
+    """
+    column = np.char.strip(column)
+    is_valid = np.char.isdigit(column)
+    values = np.zeros(len(column), dtype=np.int64)
+    values[is_valid] = column[is_valid].astype(np.int64)
+
+    if allow_blank:
+        is_valid &= values != 0
+        is_valid |= column == b''
+
+    return values, is_valid
+
+
+def get_float_column(column):
+    """
+    Convert a column of fixed-width fields into floats (blank fields are converted
+    to 0.0).
+
+    Parameters
+    ----------
+    column : numpy.ndarray
+        Fields (bytes).
+
+    Returns
+    -------
+    numpy.ndarray
+        Values.
+    numpy.ndarray
+        Whether or not each field is a valid float (as in `process_fields`) or blank.
+    """
+    is_float = np.char.find(column, b'.') >= 0
+    is_valid = is_float | (np.char.strip(column) == b'')
+    values = np.zeros(len(column))
+
+    try:
+        values[is_float] = column[is_float].astype(np.float64)
+    except ValueError: # Nastran implicit exponents (i.e. '1.5-3')
+
+        for index in np.flatnonzero(is_float):
+
+            try:
+                values[index] = process_fields([column[index].decode()], True)[0]
+            except ValueError:
+                is_valid[index] = False
+
+    return values, is_valid
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 def print_card(fields, large_field=False, free_field=False,
                comment='', is_commented=False, comment_symbol='$: ',
                use_continuation_marks=True):
@@ -26,9 +29,7 @@ def print_card(fields, large_field=False, free_field=False,
      +        39723.1-3021.86-1992.12'
     """
 
-    if is_commented and comment:
-        comment = '\n'.join((comment_symbol + line for line in comment.splitlines())) + '\n'
-
+    comment = format_comment(comment, is_commented, comment_symbol)
     card = fields[0]
 
     if large_field:
@@ -79,6 +80,122 @@ def print_card(fields, large_field=False, free_field=False,
     return comment + comment_mark + card[:card_length]
 
 
+def format_comment(comment, is_commented=False, comment_symbol='$: '):
+    """
+    Get the comment of a card as printed before it (see `print_card`).
+    """
+
+    if is_commented and comment:
+        return '\n'.join((comment_symbol + line for line in comment.splitlines())) + '\n'
+
+    return comment
+
+
+def print_cards(cards, print_comment=False, is_commented=None, comment_symbol='$: ', chunk_size=100000,
+                cache=True):
+    """
+    Get the properly formatted strings of several cards.
+
+    The real fields of each chunk of cards are formatted at once (see
+    `print_doubles`).
+
+    Parameters
+    ----------
+    cards : iterable of Card
+        Cards to print.
+    print_comment : bool, optional
+        Whether or not to print the comments of the cards.
+    is_commented : bool, optional
+        Whether or not to print the cards commented (the default is None, which
+        implies the `is_commented` attribute of each card will be used).
+    comment_symbol : str, optional
+        Comment symbol.
+    chunk_size : int, optional
+        Number of cards formatted at once.
+    cache : bool, optional
+        Whether or not to keep the text of the cards cached (see `Card.print`).
+        Texts already cached are used anyway.
+
+    Yields
+    -------
+    str
+        Properly formatted card string.
+    """
+    cards = iter(cards)
+
+    while True:
+        chunk = [card for _, card in zip(range(chunk_size), cards)]
+
+        if not chunk:
+            break
+
+        # Cards already printed in the same format are not formatted again (see `Card.print`)
+        chunk_fields = [None if card._is_cached(is_commented, comment_symbol) else card.get_fields() for
+                        card in chunk]
+        format_real_fields([fields for fields in chunk_fields if fields],
+                           [16 if card.large_field else 8 for card, fields in zip(chunk, chunk_fields) if fields])
+
+        for card, fields in zip(chunk, chunk_fields):
+            yield card.print(print_comment=print_comment, is_commented=is_commented,
+                             comment_symbol=comment_symbol, cache=cache, _fields=fields)
+
+
+def write_chunks(f, texts, buffer_size=2 ** 22):
+    """
+    Write several strings to a file joined into a few big writes.
+
+    Parameters
+    ----------
+    f : file object
+        File opened in text mode.
+    texts : iterable of str
+        Strings to write.
+    buffer_size : int, optional
+        Number of characters joined before each write.
+    """
+    buffer = list()
+    size = 0
+
+    for text in texts:
+        buffer.append(text)
+        size += len(text)
+
+        if size >= buffer_size:
+            f.write(''.join(buffer))
+            buffer = list()
+            size = 0
+
+    if buffer:
+        f.write(''.join(buffer))
+
+
+def format_real_fields(cards_fields, field_lengths):
+    """
+    Replace the real fields of several cards by their formatted strings (all of
+    them formatted at once, see `print_doubles`).
+
+    Parameters
+    ----------
+    cards_fields : list of list
+        Fields of each card (modified in place).
+    field_lengths : list of int
+        Field length of each card (8 or 16).
+    """
+    locations = {8: list(), 16: list()}
+
+    for fields, field_length in zip(cards_fields, field_lengths):
+        locations[field_length] += [(fields, index) for index, field in enumerate(fields) if
+                                    isinstance(field, float)]
+
+    for field_length, field_locations in locations.items():
+
+        if field_locations:
+            values = [fields[index] for fields, index in field_locations]
+
+            for (fields, index), field in zip(field_locations, print_doubles(values, field_length).tolist()):
+                fields[index] = field
+
+
 def print_field(value, field_length=8, free_field=False):
 
     if isinstance(value, float):
@@ -94,9 +211,15 @@ def print_field(value, field_length=8, free_field=False):
         return field
 
 
-def print_double(value, field_length=8):
-    f_format = '{{0: {}.{}{}}}'.format(field_length, field_length - 1, 'f')
-    E_format = '{{0: {}.{}{}}}'.format(field_length, field_length - 1, 'E')
+def print_double(value, field_length=8, formats=dict()):
+
+    try:
+        f_format, E_format = formats[field_length]
+    except KeyError:
+        f_format = '{{0: {}.{}{}}}'.format(field_length, field_length - 1, 'f')
+        E_format = '{{0: {}.{}{}}}'.format(field_length, field_length - 1, 'E')
+        formats[field_length] = f_format, E_format
+
     exponent = ''
     available_chars = field_length
 
@@ -125,3 +248,201 @@ def print_double(value, field_length=8):
         significant += '0'
 
     return (significant[:available_chars] + exponent).rjust(field_length)
+
+
+def print_doubles(values, field_length=8):
+    """
+    Format several real fields at once (vectorized `print_double`).
+
+    Parameters
+    ----------
+    values : array_like of float
+        Field values.
+    field_length : int, optional
+        Field length (8 or 16).
+
+    Returns
+    -------
+    numpy.ndarray of str
+        Fields (with the same shape as `values`), exactly as `print_double` formats
+        them.
+
+    Examples
+    --------
+    >>> print_doubles([39822.0, -3018.15, 1.5e-6])
+    array([' 39822.0', '-3018.15', '  1.5E-6'], dtype='<U8')
+    """
+    values = np.asarray(values, dtype=float)
+    shape = values.shape
+    values = values.ravel()
+    n = field_length
+    fields = np.full((len(values), n), ord(' '), np.uint8)
+    is_zero = values == 0
+    is_fixed = (-100000 < values) & (values <= -0.001) | (0.001 <= values) & (values < 100000)
+    is_exp = ~(is_zero | is_fixed)
+
+    for value in values[is_exp][~np.isfinite(values[is_exp])][:1]:
+        print_double(value, n) # Raises the same error
+
+    fields[is_zero, n - 3:] = np.frombuffer(b'0.0', np.uint8)
+
+    if is_fixed.any():
+        chars = get_fixed_chars(values[is_fixed], n)
+        sign = chars[:, :1]
+        digits = chars[:, 1:n] # Truncated
+        # Leading and trailing zeros are stripped
+        start = (digits[:, 0] == ord('0')).astype(int)
+        end = get_stripped_length(digits)
+        significant, length = get_significant(np.hstack((sign, shift_left(digits, start))), 1 + end - start)
+        fields[is_fixed] = join_right([(significant, np.minimum(length, n))], n)
+
+    if is_exp.any():
+        chars, lengths = get_exp_chars(values[is_exp], n)
+        # Mantissa (truncated) without trailing zeros
+        end = get_stripped_length(chars[:, :n])
+        # Exponent without the leading zero of its digits
+        exponent_start = n + 3
+        drop_zero = (chars[:, exponent_start + 1] == ord('0')).astype(int)
+        digits = shift_left(chars[:, exponent_start + 1:], drop_zero)
+        n_digits = lengths - exponent_start - 1 - drop_zero
+        available_chars = n - 1 - n_digits
+        use_E = end < available_chars
+        available_chars -= use_E
+        exponent = np.hstack((np.where(use_E, ord('E'), chars[:, exponent_start])[:, np.newaxis],
+                              chars[:, exponent_start:exponent_start + 1], digits))
+        exponent = shift_left(exponent, 1 - use_E)
+        significant, length = get_significant(chars[:, :n], end)
+        fields[is_exp] = join_right([(significant, np.minimum(length, available_chars)),
+                                     (exponent, 1 + use_E + n_digits)], n)
+
+    return fields.view('S{}'.format(n)).ravel().astype('U{}'.format(n)).reshape(shape)
+
+
+def get_chars(strings):
+    # Characters of an array of ASCII strings (n x max length, padded with zeros)
+    strings = strings.astype('S')
+    return strings.view(np.uint8).reshape(len(strings), strings.itemsize)
+
+
+def get_digits(numbers, n_digits):
+    # Decimal digits (characters) of an array of non-negative integers
+    return (numbers[:, np.newaxis] // 10 ** np.arange(n_digits - 1, -1, -1, dtype=np.int64) % 10 +
+            ord('0')).astype(np.uint8)
+
+
+def get_fixed_chars(values, n):
+    """
+    Characters of '{: .{n - 1}f}'.format(value) for several values with
+    0.001 <= abs(value) < 100000 (n x 15, padded with zeros).
+
+    For 8-character fields the digits are computed with integer arithmetic (only
+    the values too close to a rounding tie are formatted by Python).
+    """
+
+    if n != 8:
+        return get_chars(np.char.mod('% .{}f'.format(n - 1), values))
+
+    scaled = np.abs(values) * 1e7
+    rounded = np.rint(scaled)
+    is_tie = np.abs(np.abs(scaled - np.floor(scaled)) - 0.5) < 1e-3
+    numbers = rounded.astype(np.int64)
+    integer_part = numbers // 10 ** 7
+    n_integer_digits = np.maximum(np.floor(np.log10(np.maximum(integer_part, 1))).astype(int) + 1, 1)
+    chars = np.zeros((len(values), 15), np.uint8)
+    chars[:, 0] = np.where(values < 0, ord('-'), ord(' '))
+    chars[:, 1:7] = get_digits(integer_part, 6)
+    chars[:, 7] = ord('.')
+    chars[:, 8:] = get_digits(numbers % 10 ** 7, 7)
+    chars[:, 1:] = shift_left(chars[:, 1:], 6 - n_integer_digits)
+
+    if is_tie.any():
+        python_chars = get_chars(np.char.mod('% .7f', values[is_tie]))
+        chars[is_tie] = 0
+        chars[is_tie, :python_chars.shape[1]] = python_chars
+
+    return chars
+
+
+def get_exp_chars(values, n):
+    """
+    Characters of '{: .{n - 1}E}'.format(value) for several finite non zero
+    values (n x maximum length, padded with zeros) and their lengths.
+
+    For 8-character fields the digits are computed with floating-point arithmetic
+    (only the values too close to a rounding tie, or to a power of ten, and the
+    extreme ones are formatted by Python).
+    """
+
+    if n != 8:
+        strings = np.char.mod('% .{}E'.format(n - 1), values)
+        return get_chars(strings), np.char.str_len(strings)
+
+    abs_values = np.abs(values)
+    is_python = (abs_values < 1e-300) | (abs_values > 1e300)
+    abs_values[is_python] = 1.0
+    exponent = np.floor(np.log10(abs_values)).astype(int)
+    scaled = abs_values / 10.0 ** exponent * 1e7
+    # log10 may be wrong by one near powers of ten
+    exponent += (scaled >= 1e8).astype(int) - (scaled < 1e7)
+    scaled = abs_values / 10.0 ** exponent * 1e7
+    rounded = np.rint(scaled)
+    is_python |= ((np.abs(np.abs(scaled - np.floor(scaled)) - 0.5) < 1e-3) | (scaled < 1e7) |
+                  (rounded >= 1e8))
+    numbers = np.clip(rounded, 1e7, 1e8 - 1).astype(np.int64)
+    lengths = np.where(np.abs(exponent) < 100, 14, 15)
+    chars = np.zeros((len(values), 15), np.uint8)
+    chars[:, 0] = np.where(values < 0, ord('-'), ord(' '))
+    digits = get_digits(numbers, 8)
+    chars[:, 1] = digits[:, 0]
+    chars[:, 2] = ord('.')
+    chars[:, 3:10] = digits[:, 1:]
+    chars[:, 10] = ord('E')
+    chars[:, 11] = np.where(exponent < 0, ord('-'), ord('+'))
+    chars[:, 12:] = get_digits(np.abs(exponent), 3)
+    chars[:, 12:] = shift_left(chars[:, 12:], (lengths == 14).astype(int))
+
+    if is_python.any():
+        strings = np.char.mod('% .7E', values[is_python])
+        python_chars = get_chars(strings)
+        chars[is_python] = 0
+        chars[is_python, :python_chars.shape[1]] = python_chars
+        lengths[is_python] = np.char.str_len(strings)
+
+    return chars, lengths
+
+
+def get_stripped_length(chars):
+    # Length without trailing zeros (there is always a non zero character)
+    return chars.shape[1] - np.argmax(chars[:, ::-1] != ord('0'), axis=1)
+
+
+def shift_left(chars, shift):
+    # Shift each row of characters to the left (padding with zeros)
+    index = np.arange(chars.shape[1]) + shift[:, np.newaxis]
+    shifted = np.take_along_axis(chars, np.minimum(index, chars.shape[1] - 1), axis=1)
+    shifted[index >= chars.shape[1]] = 0
+    return shifted
+
+
+def get_significant(chars, length):
+    # Significant part of the field (a '0' is appended if it ends with '.')
+    rows = np.arange(len(chars))
+    chars = np.hstack((chars, np.zeros((len(chars), 1), np.uint8)))
+    is_integer = chars[rows, length - 1] == ord('.')
+    chars[rows[is_integer], length[is_integer]] = ord('0')
+    return chars, length + is_integer
+
+
+def join_right(parts, n):
+    # Join variable-length rows of characters, right-justified in n characters
+    total = sum(length for _, length in parts)
+    position = np.arange(n) - (n - total)[:, np.newaxis]
+    joined = np.full(position.shape, ord(' '), np.uint8)
+
+    for chars, length in parts:
+        is_part = (position >= 0) & (position < length[:, np.newaxis])
+        part = np.take_along_axis(chars, np.clip(position, 0, chars.shape[1] - 1), axis=1)
+        joined[is_part] = part[is_part]
+        position = position - length[:, np.newaxis]
+
+    return joined
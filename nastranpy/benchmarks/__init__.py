@@ -0,0 +1,2 @@
+from nastranpy.benchmarks.generate_deck import generate_deck
+from nastranpy.benchmarks.run_benchmarks import run_benchmarks, benchmarks
@@ -0,0 +1,24 @@
+import argparse
+from nastranpy.benchmarks.run_benchmarks import run_benchmarks, benchmarks
+
+
+parser = argparse.ArgumentParser(prog='python -m nastranpy.benchmarks',
+                                 description='Run the parser benchmarks on a synthetic (or given) model.')
+parser.add_argument('file', nargs='?', help='main file of the model (a synthetic one is generated by default)')
+parser.add_argument('--benchmarks', nargs='+', choices=list(benchmarks), help='benchmarks to run (all by default)')
+parser.add_argument('--repeat', type=int, default=3, help='runs of each benchmark (the fastest one is reported)')
+parser.add_argument('--grids', type=int, default=100000, help='number of grids')
+parser.add_argument('--elems', type=int, help='number of elements (as many as the grids allow by default)')
+parser.add_argument('--formats', type=float, nargs=3, default=(1.0, 0.0, 0.0), metavar=('SMALL', 'LARGE', 'FREE'),
+                    help='fractions of cards in small, large and free-field format')
+parser.add_argument('--coord-depth', type=int, default=2, help='number of nested coordinate systems')
+parser.add_argument('--includes', type=int, default=4, help='number of include files')
+parser.add_argument('--seed', type=int, default=0, help='random seed')
+args = parser.parse_args()
+
+if args.file:
+    run_benchmarks(args.file, args.benchmarks, args.repeat)
+else:
+    run_benchmarks(names=args.benchmarks, repeat=args.repeat, n_grids=args.grids, n_elems=args.elems,
+                   formats=args.formats, coord_depth=args.coord_depth, n_includes=args.includes,
+                   seed=args.seed)
@@ -0,0 +1,87 @@
+import os
+import numpy as np
+from nastranpy.bdf.write_bdf import print_card
+
+
+def generate_deck(path, n_grids=100000, n_elems=None, formats=(1.0, 0.0, 0.0), coord_depth=2,
+                  n_includes=4, seed=0):
+    """
+    Write a synthetic model (a structured mesh of CQUAD4 elements).
+
+    The main file holds the coordinate systems, the material, the property and
+    the INCLUDE cards. Grids and elements are split evenly among the include files.
+
+    Parameters
+    ----------
+    path : str
+        Output directory.
+    n_grids : int, optional
+        Number of grids.
+    n_elems : int, optional
+        Number of elements (the default is None, which implies as many elements as
+        the grids allow). It is limited to the cells of the mesh.
+    formats : tuple of float, optional
+        Fractions of cards written in small-field, large-field and free-field format.
+    coord_depth : int, optional
+        Number of nested coordinate systems (each one defined in the previous one).
+        Grids are defined randomly in any of them.
+    n_includes : int, optional
+        Number of include files.
+    seed : int, optional
+        Random seed (the same arguments always generate the same model).
+
+    Returns
+    -------
+    str
+        Main file path.
+
+    Examples
+    --------
+    >>> generate_deck('bench', 10 ** 6, formats=(0.8, 0.1, 0.1), coord_depth=4, n_includes=16)
+    """
+    random = np.random.RandomState(seed)
+    formats = np.array(formats, dtype=float) / sum(formats)
+    os.makedirs(path, exist_ok=True)
+
+    def print_cards(f, cards):
+        card_formats = random.choice(3, len(cards), p=formats)
+
+        for fields, card_format in zip(cards, card_formats.tolist()):
+            f.write(print_card(fields, large_field=card_format == 1, free_field=card_format == 2) + '\n')
+
+    # Structured mesh of nx x ny grids
+    nx = int(np.ceil(np.sqrt(n_grids)))
+    grid_ids = np.arange(1, n_grids + 1)
+    i, j = (grid_ids - 1) % nx, (grid_ids - 1) // nx
+    xyz = np.column_stack((i, j, np.zeros(n_grids))) + random.uniform(-0.25, 0.25, (n_grids, 3))
+    xyz = np.round(xyz, 3)
+    grid_coords = random.randint(0, coord_depth + 1, n_grids)
+
+    cells = grid_ids[(i < nx - 1) & (grid_ids + nx + 1 <= n_grids)]
+
+    if not n_elems is None:
+        cells = cells[:n_elems]
+
+    elem_grids = np.column_stack((cells, cells + 1, cells + nx + 1, cells + nx))
+
+    main_file = os.path.join(path, 'main.bdf')
+    includes = ['include_{}.bdf'.format(index) for index in range(n_includes)]
+
+    with open(main_file, 'w') as f:
+        print_cards(f, [['CORD2R', coord_id, coord_id - 1, 1.0, 2.0, 3.0, 1.0, 2.0, 4.0, 2.0, 2.0, 3.0] for
+                        coord_id in range(1, coord_depth + 1)])
+        print_cards(f, [['MAT1', 1, 70000.0, '', 0.3], ['PSHELL', 1, 1, 1.5, 1, '', 1]])
+
+        for include in includes:
+            f.write("INCLUDE '{}'\n".format(include))
+
+    for include, grids, elems in zip(includes, np.array_split(np.arange(n_grids), n_includes),
+                                     np.array_split(np.arange(len(cells)), n_includes)):
+
+        with open(os.path.join(path, include), 'w') as f:
+            print_cards(f, [['GRID', grid_id, coord_id or '', x, y, z] for grid_id, coord_id, (x, y, z) in
+                            zip(grid_ids[grids].tolist(), grid_coords[grids].tolist(), xyz[grids].tolist())])
+            print_cards(f, [['CQUAD4', int(cells[elem]), 1] + grids for elem, grids in
+                            zip(elems.tolist(), elem_grids[elems].tolist())])
+
+    return main_file
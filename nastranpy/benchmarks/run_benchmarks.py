@@ -0,0 +1,266 @@
+import os
+import time
+import shutil
+import logging
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from nastranpy.bdf.model import Model
+from nastranpy.bdf.read_bdf import cards_in_file, fields_in_files, process_fields
+from nastranpy.bdf.write_bdf import print_card
+from nastranpy.bdf.cards.card_factory import card_factory
+from nastranpy.benchmarks.generate_deck import generate_deck
+
+try:
+    import resource
+except ImportError: # Not available on Windows
+    resource = None
+
+
+def get_model(file, process=True):
+    # Model read without logging (its cards may be left unprocessed)
+    model = Model()
+    model._log.setLevel(logging.ERROR)
+    model.path = os.path.dirname(file)
+    os.chdir(model.path)
+
+    for include, fields, is_large_field, is_free_field, comment in fields_in_files([os.path.basename(file)]):
+        card = card_factory.get_card(fields, large_field=is_large_field, free_field=is_free_field)
+        card.include = include
+        card.comment = comment
+        model._classify_card(card)
+
+    if process:
+
+        for card in model._cards():
+            card._process_fields(model.all_items)
+
+        model._arrange_grids()
+
+    return model
+
+
+def files_size(file):
+    path = os.path.dirname(file)
+    return sum(os.path.getsize(os.path.join(path, include)) for include in os.listdir(path) if
+               include.endswith('.bdf'))
+
+
+def bench_cards_in_file(file):
+    n_cards = 0
+    start = time.perf_counter()
+
+    for card in cards_in_file(file, generic_cards=False):
+        n_cards += 1
+
+    return time.perf_counter() - start, n_cards, files_size(file)
+
+
+def bench_process_fields(file):
+    path = os.path.dirname(file)
+    cards = list()
+
+    # Raw fields of the small-field cards (as passed by the parser)
+    for include in sorted(os.listdir(path)):
+
+        if include.endswith('.bdf'):
+
+            with open(os.path.join(path, include)) as f:
+
+                for line in f:
+
+                    if (line[:1].isalpha() and not ',' in line[:8] and not '*' in line[:8] and
+                        line[:7].upper() != 'INCLUDE'):
+                        cards.append([line[:8]] + [line[:-1][8 + i * 8:16 + i * 8] for i in range(8)])
+
+    start = time.perf_counter()
+
+    for fields in cards:
+        process_fields(fields, True)
+
+    return time.perf_counter() - start, len(cards), sum(len(''.join(fields)) for fields in cards)
+
+
+def bench_card_process_fields(file):
+    model = get_model(file, process=False)
+    cards = list(model._cards())
+    start = time.perf_counter()
+
+    for card in cards:
+        card._process_fields(model.all_items)
+
+    return time.perf_counter() - start, len(cards), files_size(file)
+
+
+def bench_arrange_grids(file):
+    model = get_model(file)
+    start = time.perf_counter()
+    model._arrange_grids()
+    return time.perf_counter() - start, len(model.grids), None
+
+
+def bench_print_card(file):
+    model = get_model(file, process=False)
+    cards = [(card.get_fields(), card.large_field, card.free_field) for card in model._cards()]
+    n_bytes = 0
+    start = time.perf_counter()
+
+    for fields, large_field, free_field in cards:
+        n_bytes += len(print_card(fields, large_field, free_field))
+
+    return time.perf_counter() - start, len(cards), n_bytes
+
+
+def bench_model_cards(file):
+    model = get_model(file)
+    elem_ids = list(model.elems)[::10]
+    includes = list(model.includes)[-1:]
+    n_cards = 0
+    start = time.perf_counter()
+    n_cards += sum(1 for card in model.cards('grid'))
+    n_cards += sum(1 for card in model.cards('elem', elem_ids))
+    n_cards += sum(1 for card in model.cards(['GRID', 'CQUAD4'], includes=includes))
+    return time.perf_counter() - start, n_cards, None
+
+
+def bench_model_read(file):
+    model = Model()
+    model._log.setLevel(logging.ERROR)
+    start = time.perf_counter()
+    model.read([file])
+    return time.perf_counter() - start, len(list(model._cards())), files_size(file)
+
+
+def bench_model_write(file):
+    path = tempfile.mkdtemp()
+
+    try:
+        copy_path = os.path.join(path, 'deck')
+        shutil.copytree(os.path.dirname(file), copy_path)
+        model = get_model(os.path.join(copy_path, os.path.basename(file)))
+        start = time.perf_counter()
+        model.write(list(model.includes), reformat=True)
+        elapsed = time.perf_counter() - start
+        return elapsed, len(list(model._cards())), files_size(os.path.join(copy_path, os.path.basename(file)))
+    finally:
+        shutil.rmtree(path)
+
+
+def bench_model_write_edited(file):
+    # Only the include file of the edited grid is written (the rest of its cards are copied verbatim)
+    path = tempfile.mkdtemp()
+
+    try:
+        copy_path = os.path.join(path, 'deck')
+        shutil.copytree(os.path.dirname(file), copy_path)
+        model = get_model(os.path.join(copy_path, os.path.basename(file)))
+        model._stamp_includes()
+        grid = next(iter(model.grids.values()))
+        grid.xyz = [x + 1.0 for x in grid.xyz]
+        start = time.perf_counter()
+        model.write()
+        elapsed = time.perf_counter() - start
+        return elapsed, len(grid.include.cards), os.path.getsize(grid.include.file)
+    finally:
+        shutil.rmtree(path)
+
+
+benchmarks = {
+    'cards_in_file': bench_cards_in_file,
+    'process_fields': bench_process_fields,
+    '_process_fields': bench_card_process_fields,
+    '_arrange_grids': bench_arrange_grids,
+    'print_card': bench_print_card,
+    'Model.cards': bench_model_cards,
+    'Model.read': bench_model_read,
+    'Model.write': bench_model_write,
+    'Model.write (1 edit)': bench_model_write_edited,
+}
+
+
+def run_benchmark(name, file):
+    # Executed in a new process, so the peak RSS is the one of this benchmark alone
+    elapsed, n_cards, n_bytes = benchmarks[name](file)
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024 if resource else None
+    return elapsed, n_cards, n_bytes, peak_rss
+
+
+def run_benchmarks(file=None, names=None, repeat=3, print_to_screen=True, **kwargs):
+    """
+    Run the parser benchmarks on a model (each one in a new process).
+
+    Parameters
+    ----------
+    file : str, optional
+        Main file of the model (the default is None, which implies a synthetic
+        model will be generated in a temporary directory, see `generate_deck`).
+    names : list of str, optional
+        Benchmarks to run (the default is None, which implies all of them):
+        'cards_in_file', 'process_fields', '_process_fields', '_arrange_grids',
+        'print_card', 'Model.cards', 'Model.read', 'Model.write' and 'Model.write
+        (1 edit)'.
+    repeat : int, optional
+        Number of runs of each benchmark (the fastest one is reported).
+    print_to_screen : bool, optional
+        Whether or not to print the results.
+    **kwargs
+        Arguments passed to `generate_deck` (if no `file` is supplied).
+
+    Returns
+    -------
+    dict
+        Results by benchmark name: {'time': seconds, 'cards/s': ..., 'MB/s': ...
+        (None if not applicable), 'peak RSS': MB (None if not available)}.
+
+    Examples
+    --------
+    >>> results = run_benchmarks(n_grids=10 ** 6, formats=(0.8, 0.1, 0.1), coord_depth=4)
+    """
+    path = None
+
+    if not file:
+        path = tempfile.mkdtemp()
+        file = generate_deck(path, **kwargs)
+
+    file = os.path.abspath(file)
+    results = dict()
+
+    try:
+
+        for name in names or benchmarks:
+            runs = list()
+
+            for i in range(repeat):
+
+                with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context('spawn')) as executor:
+                    runs.append(executor.submit(run_benchmark, name, file).result())
+
+            elapsed, n_cards, n_bytes, _ = min(runs)
+            peak_rss = max(run[3] for run in runs) if resource else None
+            results[name] = {
+                'time': elapsed,
+                'cards/s': n_cards / elapsed if elapsed else None,
+                'MB/s': n_bytes / elapsed / 2 ** 20 if n_bytes and elapsed else None,
+                'peak RSS': peak_rss / 2 ** 20 if peak_rss else None,
+            }
+
+    finally:
+
+        if path:
+            shutil.rmtree(path)
+
+    if print_to_screen:
+        print_results(results)
+
+    return results
+
+
+def print_results(results):
+    print('{:<22}{:>12}{:>14}{:>10}{:>14}'.format('Benchmark', 'Time [s]', 'Cards/s', 'MB/s', 'Peak RSS [MB]'))
+
+    for name, result in results.items():
+        print('{:<22}{:>12.3f}{:>14}{:>10}{:>14}'.format(
+            name, result['time'],
+            '{:.0f}'.format(result['cards/s']) if result['cards/s'] else '-',
+            '{:.1f}'.format(result['MB/s']) if result['MB/s'] else '-',
+            '{:.0f}'.format(result['peak RSS']) if result['peak RSS'] else '-'))
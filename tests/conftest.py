@@ -0,0 +1,84 @@
+import os
+import logging
+import pytest
+from nastranpy.bdf.model import Model
+
+
+def fixed(*fields, width=8):
+    # Line of a card in fixed format (small field, or large field if `width` is 16)
+    return (fields[0].ljust(8) + ''.join(str(field).rjust(width) for field in fields[1:])).rstrip() + '\n'
+
+
+MAIN = ("$ Main file\n"
+        "INCLUDE 'grids.bdf'\n"
+        "INCLUDE 'elems.bdf'\n"
+        "PARAM,POST,-1\n" +
+        fixed('EIGRL', '', '', 10))
+
+GRIDS = ("$ Grids\n" +
+         fixed('CORD2R', 1, '', '0.', '0.', '0.', '0.', '0.', '1.') +
+         fixed('', '0.', '1.', '0.') +
+         fixed('GRID', 1, '', '0.', '0.', '0.') +
+         fixed('GRID', 2, '', '1.', '0.', '0.') +
+         fixed('GRID', 3, 1, '1.', '1.', '0.') +
+         fixed('GRID', 4, '', '0.', '1.', '0.') +
+         "GRID,5,,2.,0.,0.\n" +
+         fixed('GRID*', 6, '', '2.', '1.', width=16) +
+         fixed('*', '0.', width=16))
+
+ELEMS = ("$ Elements\n" +
+         fixed('CQUAD4', 100, 1, 1, 2, 3, 4) +
+         "$ Second element\n" +
+         fixed('CQUAD4', 101, 1, 2, 5, 6, 3) +
+         fixed('CTRIA3', 102, 1, 1, 2, 4) +
+         fixed('PSHELL', 1, 1, '.1', 1) +
+         fixed('MAT1', 1, '70000.', '', '.3'))
+
+
+@pytest.fixture(autouse=True)
+def work_path(tmp_path, monkeypatch):
+    # Models are readed from the temporary directory (`Model.read` changes the working directory)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def deck(tmp_path):
+    """
+    Small model split in three include files (main file path).
+    """
+    path = tmp_path / 'deck'
+    path.mkdir()
+
+    for file, contents in (('main.bdf', MAIN), ('grids.bdf', GRIDS), ('elems.bdf', ELEMS)):
+        (path / file).write_text(contents)
+
+    return str(path / 'main.bdf')
+
+
+@pytest.fixture
+def read():
+    """
+    Read a model without logging to the console.
+    """
+
+    def read_model(file, **kwargs):
+        model = Model()
+        model._log.setLevel(logging.ERROR)
+        model.read([file], **kwargs)
+        return model
+
+    return read_model
+
+
+@pytest.fixture
+def card_fields():
+    """
+    Fields of all the cards of a model (to compare models readed in different ways).
+    """
+
+    def get_card_fields(model):
+        return sorted((card.include.file if card.include else '', str(card.get_fields())) for
+                      card in model.cards())
+
+    return get_card_fields
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+from conftest import fixed, GRIDS
+
+
+def check_grid_store(model):
+    grid_store = model.grid_store
+    assert len(grid_store) == len(model.grids)
+    assert sorted(grid_store.ids.tolist()) == sorted(model.grids)
+    assert not np.isnan(grid_store.xyz0).any()
+
+    for grid_id, grid in model.grids.items():
+        row = grid_store.index[grid_id]
+        assert grid_store.grids[row] is grid and grid._row == row
+        assert grid_store.xyz0[row].tolist() == grid.xyz0.tolist()
+        assert grid_store.xyz[row] == pytest.approx(grid.xyz)
+
+
+def test_grid_store(deck, read):
+    model = read(deck)
+    check_grid_store(model)
+    grid_store = model.grid_store
+    assert grid_store.xyz[grid_store.index[3]].tolist() == [1.0, 1.0, 0.0]
+    assert grid_store.xyz0[grid_store.index[3]] == pytest.approx([-1.0, 1.0, 0.0])
+    assert grid_store.cp[grid_store.index[3]] == 1
+
+    # Edits
+    model.grids[2].xyz = [5.0, 0.0, 0.0]
+    model.grids[4].id = 40
+    model.create_card(['GRID', 7, None, 0.0, 0.0, 1.0], include='grids.bdf')
+    model.create_card(['GRID', 8, None, 0.0, 0.0, 2.0], include='grids.bdf')
+    model.delete_card(model.grids[7]) # Last row of the grid store moved to its one
+    check_grid_store(model)
+    assert grid_store.xyz0[grid_store.index[2]].tolist() == [5.0, 0.0, 0.0]
+
+    # Coordinate system changes keep basic coordinates (local ones are computed again)
+    model.coords[1].rotate('z', 90.0)
+    check_grid_store(model)
+    assert grid_store.xyz[grid_store.index[3]] == pytest.approx(model.coords[1].get_xyz(model.grids[3].xyz0))
+
+
+@pytest.mark.parametrize('kwargs', [{}, {'engine': 'mmap'}, {'lazy': True}, {'bulk': True}])
+def test_duplicate_grid_ids(deck, read, kwargs):
+    # The last card overwrites the previous one (also in the grid store)
+    grids_file = deck.replace('main.bdf', 'grids.bdf')
+
+    with open(grids_file, 'w') as f:
+        f.write(GRIDS + fixed('GRID', 2, '', '9.', '0.', '0.'))
+
+    model = read(grids_file, **kwargs)
+    model.materialize()
+    check_grid_store(model)
+    assert model.grids[2].xyz0.tolist() == [9.0, 0.0, 0.0]
+
+
+def test_connectivity(deck, read):
+    model = read(deck)
+    grid_store = model.grid_store
+    table = model.connectivity('CQUAD4')
+    assert grid_store.ids[table.grid_rows].tolist() == [[1, 2, 3, 4], [2, 5, 6, 3]]
+    assert table.ids.tolist() == [100, 101]
+
+    # Edits
+    model.elems[100].grids[0] = model.grids[5]
+    model.create_card(['GRID', 7, None, 0.0, 0.0, 1.0], include='grids.bdf')
+    model.create_card(['GRID', 8, None, 0.0, 0.0, 2.0], include='grids.bdf')
+    model.create_card(['CQUAD4', 103, 1, 3, 4, 8, 6], include='elems.bdf')
+    model.delete_card(model.grids[7]) # Last row of the grid store (GRID 8) moved to its one
+    assert {elem_id: grid_store.ids[table.grid_rows[row]].tolist() for elem_id, row in table.index.items()} == {
+        100: [5, 2, 3, 4], 101: [2, 5, 6, 3], 103: [3, 4, 8, 6]}
+    model.delete_card(model.elems[100])
+    assert table.ids.tolist() == [103, 101]
+
+    with pytest.raises(ValueError):
+        model.connectivity('PSHELL')
@@ -0,0 +1,40 @@
+import os
+import pytest
+from nastranpy.bdf.read_bdf import cards_in_file
+
+
+def test_cards_in_file_follows_includes(deck):
+    cards = list(cards_in_file(deck))
+    assert [card.name for card in cards[:3]] == ['INCLUDE', 'CORD2R', 'GRID']
+    assert len(cards) == 16
+
+
+def test_cards_in_file_raw_output(deck):
+    # Nested includes are not followed
+    assert [fields[:2] for fields in cards_in_file(deck, raw_output=True)] == [
+        ['INCLUDE', 'grids.bdf'], ['INCLUDE', 'elems.bdf'], ['PARAM', 'POST'], ['EIGRL', '']]
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'engine': 'mmap'},
+    {'workers': 2},
+    {'workers': 2, 'shard_size': 64},
+    {'cache': True},
+    {'lazy': True},
+    {'bulk': True},
+])
+def test_read_modes(deck, read, card_fields, kwargs):
+    model = read(deck)
+    other_model = read(deck, **kwargs)
+
+    if kwargs.get('cache'): # Parsed include files are loaded from the cache the second time
+        assert os.listdir(os.path.join(os.path.dirname(deck), '.nastranpy_cache'))
+        other_model = read(deck, **kwargs)
+
+    other_model.materialize()
+    assert card_fields(other_model) == card_fields(model)
+    xyz0 = {grid.id: grid.xyz0.tolist() for grid in model.grids.values()}
+    assert {grid.id: grid.xyz0.tolist() for grid in other_model.grids.values()} == xyz0
+    grid_store = other_model.grid_store
+    assert sorted(grid_store.ids.tolist()) == sorted(xyz0)
+    assert all(grid_store.xyz0[grid_store.index[grid_id]].tolist() == xyz0[grid_id] for grid_id in xyz0)
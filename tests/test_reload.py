@@ -0,0 +1,45 @@
+import os
+from conftest import fixed, GRIDS
+
+
+def edit_file(file, contents):
+    # The file stamp (size and modification time) changes for sure
+    stamp = os.stat(file).st_mtime_ns
+
+    with open(file, 'w') as f:
+        f.write(contents)
+
+    os.utime(file, ns=(stamp + 10 ** 9, stamp + 10 ** 9))
+
+
+def test_reload(deck, read, card_fields):
+    model = read(deck)
+    table = model.connectivity('CQUAD4')
+    elem = model.elems[100]
+    old_grid = model.grids[2]
+    grids_file = os.path.join(os.path.dirname(deck), 'grids.bdf')
+    edit_file(grids_file, GRIDS.replace(fixed('GRID', 2, '', '1.', '0.', '0.'),
+                                        fixed('GRID', 2, '', '3.', '0.', '0.') +
+                                        fixed('GRID', 8, '', '4.', '0.', '0.')))
+    includes = model.reload()
+    assert [include.file for include in includes] == ['grids.bdf']
+
+    # Cards replaced and references linked again
+    grid = model.grids[2]
+    assert not grid is old_grid
+    assert grid.xyz0.tolist() == [3.0, 0.0, 0.0]
+    assert model.grids[8].xyz0.tolist() == [4.0, 0.0, 0.0]
+    assert model.elems[100] is elem and elem.grids[1] is grid
+    assert elem in grid.elems
+    assert model.grids[3].CP is model.coords[1]
+
+    # Grid store and connectivity rows
+    grid_store = model.grid_store
+    assert sorted(grid_store.ids.tolist()) == sorted(model.grids)
+    assert all(grid_store.grids[grid_store.index[grid_id]] is grid for grid_id, grid in model.grids.items())
+    assert grid_store.xyz0[grid._row].tolist() == [3.0, 0.0, 0.0]
+    assert [grid_store.ids[table.grid_rows[table.index[elem_id]]].tolist() for elem_id in (100, 101)] == [
+        [1, 2, 3, 4], [2, 5, 6, 3]]
+
+    # Same model as readed from scratch
+    assert card_fields(model) == card_fields(read(deck))
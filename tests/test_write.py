@@ -0,0 +1,90 @@
+import os
+
+
+def read_lines(file):
+
+    with open(file, newline='') as f:
+        return f.read().splitlines(keepends=True)
+
+
+def test_noop_write(deck, read):
+    model = read(deck)
+    path = os.path.dirname(deck)
+    contents = {file: read_lines(os.path.join(path, file)) for file in os.listdir(path)}
+    model.write()
+    assert not any(include.is_modified for include in model.includes.values())
+    model.write(list(model.includes))
+    assert {file: read_lines(os.path.join(path, file)) for file in os.listdir(path)} == contents
+
+
+def test_single_edit_diff(deck, read):
+    model = read(deck)
+    path = os.path.dirname(deck)
+    contents = {file: read_lines(os.path.join(path, file)) for file in os.listdir(path)}
+    model.grids[2].xyz = [5.0, 0.0, 0.0]
+    model.write(list(model.includes))
+
+    for file, lines in contents.items():
+        new_lines = read_lines(os.path.join(path, file))
+        assert len(new_lines) == len(lines)
+        changed = [index for index, (line, new_line) in enumerate(zip(lines, new_lines)) if line != new_line]
+
+        if file == 'grids.bdf':
+            assert changed == [index for index, line in enumerate(lines) if line.startswith('GRID           2 ')]
+            assert model.grids[2].xyz0.tolist() == [5.0, 0.0, 0.0]
+        else:
+            assert not changed
+
+
+def test_unedited_cards_keep_their_place(deck, read):
+    # Cards without an integer id (PARAM) or with a blank one (EIGRL) are copied too
+    model = read(deck)
+    lines = read_lines(deck)
+    model.create_card(['GRID', 7, None, 0.0, 0.0, 1.0], include='main.bdf')
+    model.write()
+    new_lines = read_lines(deck)
+    assert new_lines[:len(lines)] == lines
+    assert new_lines[len(lines):] == ['GRID           7             0.0     0.0     1.0\n']
+
+
+def test_crlf_line_endings(deck, read):
+
+    with open(deck, 'w', newline='\r\n') as f:
+        f.write("INCLUDE 'grids.bdf'\nINCLUDE 'elems.bdf'\nPARAM,POST,-1\n")
+
+    model = read(deck)
+    model.create_card(['GRID', 7, None, 0.0, 0.0, 1.0], include='main.bdf')
+    model.write()
+
+    with open(deck, 'rb') as f:
+        contents = f.read()
+
+    assert contents.count(b'\n') == contents.count(b'\r\n') == 4
+
+
+def test_reformat(deck, read, card_fields):
+    model = read(deck)
+    model.grids[2].xyz = [5.0, 0.0, 0.0]
+    model.write(list(model.includes), reformat=True)
+    assert card_fields(read(deck)) == card_fields(model)
+
+
+def test_parallel_write(deck, read):
+    model = read(deck)
+    path = os.path.dirname(deck)
+    model.grids[2].xyz = [5.0, 0.0, 0.0]
+    model.create_card(['GRID', 7, None, 0.0, 0.0, 1.0], include='main.bdf')
+    model.write(list(model.includes), workers=2)
+    contents = {file: read_lines(os.path.join(path, file)) for file in os.listdir(path)}
+    model.write(list(model.includes))
+    assert {file: read_lines(os.path.join(path, file)) for file in os.listdir(path)} == contents
+
+
+def test_print_cache(deck, read):
+    model = read(deck)
+    grid = model.grids[2]
+    text = grid.print()
+    assert grid.print() is text # Cached
+    assert grid.print(free_field=True) == 'GRID,2,,1.0,0.0,0.0'
+    grid.xyz = [5.0, 0.0, 0.0]
+    assert grid.print() == 'GRID           2             5.0     0.0     0.0'